@@ -38,6 +38,8 @@ class KeyOrderingTestCase(RuleTestCase):
                    '  second: {first: 1}\n'
                    '  third:\n'
                    '    second: 2\n', conf)
+        self.check('---\n'
+                   '[a, b, c]]\n', conf, problem=(2, 10, 'syntax'))
 
     def test_enabled(self):
         conf = 'key-ordering: enable'
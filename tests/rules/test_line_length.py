@@ -15,6 +15,9 @@
 
 from tests.common import RuleTestCase
 
+from yamllint.parser import line_generator
+from yamllint.rules import line_length
+
 
 class LineLengthTestCase(RuleTestCase):
     rule_id = 'line-length'
@@ -196,3 +199,16 @@ class LineLengthTestCase(RuleTestCase):
         self.check('---\r\nABCD EFGHI\r\n', conf)
         self.check('---\r\nABCD EFGHIJ', conf, problem=(2, 11))
         self.check('---\r\nABCD EFGHIJ\r\n', conf, problem=(2, 11))
+
+    def test_check_lines(self):
+        conf = {'max': 5, 'allow-non-breakable-words': True,
+                'allow-non-breakable-inline-mappings': False}
+        # All lines at once, like line by line
+        for buffer in ('', '123456', '12345\r\n', '123456\r\n12345\r',
+                       'a b c d\n# abcdefg\n\n- abcdefg\n  ab cd ef',
+                       '12345\n1234\r\r\n'):
+            self.assertEqual(
+                [(p.line, p.column) for p in line_length.check_lines(
+                    conf, buffer, 0, len(buffer), 1)],
+                [(p.line, p.column) for line in line_generator(buffer)
+                 for p in line_length.check(conf, line)])
@@ -15,6 +15,9 @@
 
 from tests.common import RuleTestCase
 
+from yamllint.parser import line_generator
+from yamllint.rules import trailing_spaces
+
 
 class TrailingSpacesTestCase(RuleTestCase):
     rule_id = 'trailing-spaces'
@@ -45,3 +48,13 @@ class TrailingSpacesTestCase(RuleTestCase):
                    'some: text\r\n', conf)
         self.check('---\r\n'
                    'some: text \r\n', conf, problem=(2, 11))
+
+    def test_check_lines(self):
+        # All lines at once, like line by line
+        for buffer in ('', '\n', 'a \n', 'a \r\n', 'a\r \r\n', 'a \r \n',
+                       '\x0b \n', ' \t\x0c', '\r \n', 'a\n\n  \nb \r'):
+            self.assertEqual(
+                [(p.line, p.column) for p in trailing_spaces.check_lines(
+                    {}, buffer, 0, len(buffer), 1)],
+                [(p.line, p.column) for line in line_generator(buffer)
+                 for p in trailing_spaces.check({}, line)])
@@ -0,0 +1,186 @@
+# Copyright (C) 2026 agent
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import unittest
+
+from tests.common import RunContext, temp_workspace
+
+from yamllint import cli
+from yamllint.baseline import (
+    Baseline,
+    BaselineError,
+    BaselineWriter,
+    fingerprint,
+)
+from yamllint.linter import LintProblem
+
+
+class BaselineTestCase(unittest.TestCase):
+    def test_fingerprint(self):
+        lines = ['key: value   ', '  other: value  ']
+        self.assertEqual(
+            fingerprint(LintProblem(1, 11, rule='trailing-spaces'), lines),
+            fingerprint(LintProblem(2, 15, rule='trailing-spaces'),
+                        ['', 'key: value']))
+        self.assertNotEqual(
+            fingerprint(LintProblem(1, 11, rule='trailing-spaces'), lines),
+            fingerprint(LintProblem(1, 11, rule='line-length'), lines))
+        self.assertNotEqual(
+            fingerprint(LintProblem(1, 11, rule='trailing-spaces'), lines),
+            fingerprint(LintProblem(2, 15, rule='trailing-spaces'), lines))
+        self.assertTrue(
+            fingerprint(LintProblem(3, 1), lines).startswith('syntax '))
+
+    def test_sections(self):
+        with temp_workspace({'baseline': '# yamllint baseline v1\n'
+                                         'path: "a.yaml"\n'
+                                         '  trailing-spaces 0123\n'
+                                         '  trailing-spaces 0123\n'
+                                         '\n'
+                                         'path: "dir/b.yaml"\n'
+                                         '  line-length 4567\n'}):
+            baseline = Baseline('baseline')
+            self.assertEqual(sorted(baseline.sections), ['a.yaml',
+                                                         'dir/b.yaml'])
+            self.assertEqual(baseline.known_problems('a.yaml'),
+                             {'trailing-spaces 0123': 2})
+            self.assertEqual(baseline.known_problems('dir/b.yaml'),
+                             {'line-length 4567': 1})
+            self.assertEqual(baseline.known_problems('c.yaml'), {})
+
+    def test_invalid_header(self):
+        with temp_workspace({'baseline': 'a.yaml\n'
+                                         '  trailing-spaces 0123\n'}):
+            self.assertRaises(BaselineError, Baseline, 'baseline')
+
+    def test_invalid_path(self):
+        for line in ('a.yaml', 'path: a.yaml', 'path: "a.yaml', 'path: 1'):
+            with temp_workspace({'baseline': '# yamllint baseline v1\n' +
+                                             line + '\n'
+                                             '  trailing-spaces 0123\n'}):
+                with self.assertRaisesRegex(BaselineError,
+                                            r'invalid line'):
+                    Baseline('baseline')
+
+    def test_writer(self):
+        with temp_workspace({'baseline': '# yamllint baseline v1\n'
+                                         'path: "a.yaml"\n'
+                                         '  trailing-spaces 0123\n'}):
+            os.chmod('baseline', 0o640)
+            writer = BaselineWriter('baseline')
+            writer.add([LintProblem(1, 1, rule='line-length')], 'b.yaml',
+                       'key: value\n')
+            writer.add([], 'c.yaml', 'key: value\n')
+            # The previous baseline is kept until the writer is closed
+            self.assertEqual(Baseline('baseline').known_problems('a.yaml'),
+                             {'trailing-spaces 0123': 1})
+            writer.close()
+            self.assertEqual(sorted(Baseline('baseline').sections),
+                             ['b.yaml'])
+            self.assertEqual(os.listdir('.'), ['baseline'])
+            self.assertEqual(os.stat('baseline').st_mode & 0o777, 0o640)
+            # Closing or discarding again changes nothing
+            writer.close()
+            writer.discard()
+            self.assertEqual(sorted(Baseline('baseline').sections),
+                             ['b.yaml'])
+
+            writer = BaselineWriter('baseline')
+            writer.discard()
+            writer.discard()
+            self.assertEqual(sorted(Baseline('baseline').sections),
+                             ['b.yaml'])
+            self.assertEqual(os.listdir('.'), ['baseline'])
+
+    def test_writer_paths(self):
+        paths = [' a.yaml', 'b\n  trailing-spaces 0123.yaml', '"c".yaml',
+                 'path: d.yaml', 'é.yaml']
+        with temp_workspace({'baseline.tmp': 'unrelated\n'}):
+            writer = BaselineWriter('baseline')
+            for path in paths:
+                writer.add([LintProblem(1, 1, rule='line-length')], path,
+                           'key: value\n')
+            writer.close()
+            baseline = Baseline('baseline')
+            self.assertEqual(sorted(baseline.sections), sorted(paths))
+            for path in paths:
+                self.assertEqual(len(baseline.known_problems(path)), 1)
+            # A file with the same name as the temporary file is left as is
+            with open('baseline.tmp', encoding='utf-8') as f:
+                self.assertEqual(f.read(), 'unrelated\n')
+            self.assertEqual(sorted(os.listdir('.')),
+                             ['baseline', 'baseline.tmp'])
+
+    def test_cli(self):
+        with temp_workspace({'a.yaml': '---\n'
+                                       'key: value   \n'
+                                       'other: value   \n'}):
+            with RunContext(self) as ctx:
+                cli.run(('-f', 'parsable', '--baseline', 'baseline',
+                         '--generate-baseline', 'a.yaml'))
+            self.assertEqual((ctx.returncode, ctx.stdout, ctx.stderr),
+                             (0, '', ''))
+
+            with RunContext(self) as ctx:
+                cli.run(('-f', 'parsable', '--baseline', 'baseline',
+                         'a.yaml'))
+            self.assertEqual((ctx.returncode, ctx.stdout, ctx.stderr),
+                             (0, '', ''))
+
+            # Shifting lines doesn't invalidate the baseline, but new problems
+            # are reported (even on a line identical to a known one)
+            with open('a.yaml', 'w', encoding='utf-8') as f:
+                f.write('---\n'
+                        'new: value   \n'
+                        'key: value   \n'
+                        'key2: value\n'
+                        'other: value   \n'
+                        'key: value   \n')
+            with RunContext(self) as ctx:
+                cli.run(('-f', 'parsable', '--baseline', 'baseline',
+                         'a.yaml'))
+            self.assertEqual((ctx.returncode, ctx.stderr), (1, ''))
+            self.assertEqual(ctx.stdout, (
+                'a.yaml:2:11: [error] trailing spaces (trailing-spaces)\n'
+                'a.yaml:6:1: [error] duplication of key "key" in mapping '
+                '(key-duplicates)\n'
+                'a.yaml:6:11: [error] trailing spaces (trailing-spaces)\n'))
+
+    def test_cli_missing_baseline(self):
+        with temp_workspace({'a.yaml': '---\n'
+                                       'key: value\n'}):
+            with RunContext(self) as ctx:
+                cli.run(('--baseline', 'baseline', 'a.yaml'))
+            self.assertEqual(ctx.returncode, -1)
+            self.assertRegex(ctx.stderr, r'No such file or directory')
+
+            with RunContext(self) as ctx:
+                cli.run(('--generate-baseline', 'a.yaml'))
+            self.assertEqual(ctx.returncode, 2)
+            self.assertRegex(ctx.stderr, r'requires --baseline')
+
+    def test_cli_failed_generation(self):
+        with temp_workspace({'a.yaml': '---\n'
+                                       'key: value   \n',
+                             'baseline': '# yamllint baseline v1\n'}):
+            with RunContext(self) as ctx:
+                cli.run(('--baseline', 'baseline', '--generate-baseline',
+                         'a.yaml', 'missing.yaml'))
+            self.assertEqual(ctx.returncode, -1)
+            self.assertRegex(ctx.stderr, r'No such file or directory')
+            with open('baseline', encoding='utf-8') as f:
+                self.assertEqual(f.read(), '# yamllint baseline v1\n')
+            self.assertEqual(sorted(os.listdir('.')), ['a.yaml', 'baseline'])
@@ -22,6 +22,7 @@ import shutil
 import sys
 import tempfile
 import unittest
+from unittest import mock
 
 from tests.common import (
     RunContext,
@@ -31,8 +32,9 @@ from tests.common import (
     temp_workspace_with_files_in_many_codecs,
     unregister_test_codecs
 )
+from tests.test_linter import top_level_keys
 
-from yamllint import cli, config
+from yamllint import cli, config, rules
 
 
 # Check system's UTF-8 availability
@@ -666,6 +668,59 @@ class CommandLineTestCase(unittest.TestCase):
             cli.run((path, '--no-warnings', '-s'))
         self.assertEqual(ctx.returncode, 2)
 
+    def test_run_jobs(self):
+        path = os.path.join(self.wd, 'a.yaml')
+
+        with RunContext(self) as ctx:
+            cli.run((path, '-j', '2', '-f', 'parsable'))
+        self.assertEqual(
+            (ctx.returncode, ctx.stdout, ctx.stderr), (1, (
+                f'{path}:2:4: [error] trailing spaces (trailing-spaces)\n'
+                f'{path}:3:4: [error] no new line character at the end of '
+                f'file (new-line-at-end-of-file)\n'), ''))
+
+        with RunContext(self) as ctx:
+            cli.run((path, '-j', '-1'))
+        self.assertEqual(ctx.returncode, 2)
+        self.assertRegex(ctx.stderr, r'--jobs must not be negative')
+
+    def test_run_project_rules(self):
+        files = {'a.yaml': 'key: 1\n',
+                 'b.yaml': 'other: 2  \nkey: 3\n',
+                 # Directives disable project rules too
+                 'c.yaml': 'key: 4  # yamllint disable-line\n',
+                 'd.yaml': '# yamllint disable rule:top-level-keys\n'
+                           'key: 5\n'}
+        with mock.patch.dict(rules._RULES,
+                             {'top-level-keys': top_level_keys}), \
+                temp_workspace(files):
+            with RunContext(self) as ctx:
+                cli.run(('-d', 'rules:\n'
+                               '  top-level-keys: enable\n'
+                               '  trailing-spaces: enable\n',
+                         '-f', 'parsable', '.'))
+        self.assertEqual(
+            (ctx.returncode, ctx.stdout, ctx.stderr), (1, (
+                './b.yaml:1:9: [error] trailing spaces (trailing-spaces)\n'
+                './b.yaml:2:1: [error] key "key" also defined in a.yaml '
+                '(top-level-keys)\n'), ''))
+
+    def test_run_syntax_only(self):
+        files = {'a.yaml': 'key: 1\n',
+                 'b.yaml': 'other: 2  \nkey: [3\n'}
+        with mock.patch.dict(rules._RULES,
+                             {'top-level-keys': top_level_keys}), \
+                temp_workspace(files):
+            with RunContext(self) as ctx:
+                cli.run(('-d', 'rules:\n'
+                               '  top-level-keys: enable\n'
+                               '  trailing-spaces: enable\n',
+                         '-f', 'parsable', '--syntax-only', '.'))
+        self.assertEqual(
+            (ctx.returncode, ctx.stdout, ctx.stderr), (1, (
+                "./b.yaml:3:1: [error] syntax error: expected ',' or ']', "
+                "but got '<stream end>' (syntax)\n"), ''))
+
     def test_run_non_universal_newline(self):
         path = os.path.join(self.wd, 'dos.yml')
 
@@ -20,7 +20,9 @@ import shutil
 import sys
 import tempfile
 import unittest
+from importlib.metadata import EntryPoint
 from io import StringIO
+from unittest import mock
 
 from tests.common import (
     build_temp_workspace,
@@ -29,7 +31,7 @@ from tests.common import (
     unregister_test_codecs,
 )
 
-from yamllint import cli, config
+from yamllint import cli, config, linter, rules
 from yamllint.config import YamlLintConfigError
 
 
@@ -57,6 +59,42 @@ class SimpleConfigTestCase(unittest.TestCase):
             config.YamlLintConfig('rules:\n'
                                   '  this-one-does-not-exist: enable\n')
 
+    def test_rule_plugin(self):
+        def entry_points(group, name):
+            return [entry_point for entry_point in (
+                EntryPoint('aliases', 'tests.test_linter:aliases', group),
+                EntryPoint('other', 'tests.test_linter:top_level_keys', group),
+            ) if entry_point.group == group and entry_point.name == name]
+
+        with mock.patch('importlib.metadata.entry_points',
+                        side_effect=entry_points) as entry_points_mock, \
+                mock.patch.dict(rules._RULES):
+            # Plugins are not looked up for built-in rules
+            config.YamlLintConfig('extends: default')
+            entry_points_mock.assert_not_called()
+
+            c = config.YamlLintConfig('extends: default\n'
+                                      'rules:\n'
+                                      '  aliases: enable\n')
+            self.assertEqual(entry_points_mock.call_count, 1)
+            self.assertIn('aliases', c.enabled_rule_ids(None))
+            problems = linter.run('---\n- *x\n', c)
+            self.assertEqual([(p.line, p.rule) for p in problems],
+                             [(2, 'anchors'), (2, 'aliases')])
+
+            # Once imported, the plugin is known like built-in rules
+            config.YamlLintConfig('rules:\n'
+                                  '  aliases: disable\n')
+            self.assertEqual(entry_points_mock.call_count, 1)
+
+            with self.assertRaisesRegex(
+                    config.YamlLintConfigError,
+                    'invalid config: rule "other" of tests.test_linter:'
+                    'top_level_keys has ID "top-level-keys"'):
+                config.YamlLintConfig('rules:\n'
+                                      '  other: enable\n')
+        self.assertNotIn('aliases', rules._RULES)
+
     def test_missing_option(self):
         c = config.YamlLintConfig('rules:\n'
                                   '  colons: enable\n')
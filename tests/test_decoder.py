@@ -14,6 +14,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import codecs
+import io
 import itertools
 import os
 import unittest
@@ -456,6 +457,18 @@ class DecoderTestCase(unittest.TestCase):
                  "decoding error.")
         )
 
+    def test_stream_reader(self):
+        string = '---\nkey: 😀 ⓎⒶⓂⓁ\n'
+        for stream in (io.StringIO(string),
+                       io.BytesIO(string.encode('utf_8')),
+                       io.BytesIO(string.encode('utf_8_sig')),
+                       io.BytesIO(string.encode('utf_16')),
+                       io.BytesIO(string.encode('utf_32'))):
+            read = decoder.stream_reader(stream)
+            chunks = list(iter(lambda: read(3), ('', True)))
+            self.assertEqual(''.join(text for text, _ in chunks), string)
+            self.assertFalse(any(eof for _, eof in chunks))
+
     def perform_lines_in_file_test(self, strings):
         workspace = temp_workspace_with_files_in_many_codecs(
             '{}',
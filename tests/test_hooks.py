@@ -0,0 +1,152 @@
+# Copyright (C) 2026 agent
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+from tests.common import RunContext, temp_workspace
+
+from yamllint import cli, hooks, linter
+from yamllint.config import YamlLintConfig
+
+
+class RecordingHook(hooks.Hook):
+    def __init__(self):
+        self.calls = []
+
+    def run_start(self):
+        self.calls.append(('run_start',))
+
+    def run_end(self):
+        self.calls.append(('run_end',))
+
+    def file_start(self, filepath):
+        self.calls.append(('file_start', filepath))
+
+    def file_end(self, filepath):
+        self.calls.append(('file_end', filepath))
+
+    def phase_start(self, phase, filepath):
+        self.calls.append(('phase_start', phase, filepath))
+
+    def phase_end(self, phase, filepath):
+        self.calls.append(('phase_end', phase, filepath))
+
+    def rule_stats(self, stats):
+        self.stats = stats
+        self.calls.append(('rule_stats',))
+
+
+class HooksTestCase(unittest.TestCase):
+    def test_cli(self):
+        hook = RecordingHook()
+        hooks.register(hook)
+        try:
+            with temp_workspace({'a.yaml': 'key: value  \n',
+                                 'b.yaml': '---\n- 1\n'}):
+                with RunContext(self) as ctx:
+                    cli.run(('-d', 'extends: default', 'a.yaml', 'b.yaml'))
+                with RunContext(self) as ctx2:
+                    cli.run(('-d', 'extends: default', '-j', '2', 'b.yaml'))
+        finally:
+            hooks.unregister(hook)
+        self.assertEqual(ctx.returncode, 1)
+        self.assertRegex(ctx.stdout, r'trailing spaces')
+        self.assertEqual(ctx2.returncode, 0)
+
+        self.assertEqual(hook.calls, [
+            ('run_start',),
+            ('file_start', 'a.yaml'),
+            ('phase_start', 'lint', 'a.yaml'),
+            ('phase_end', 'lint', 'a.yaml'),
+            ('phase_start', 'output', 'a.yaml'),
+            ('phase_end', 'output', 'a.yaml'),
+            ('file_end', 'a.yaml'),
+            ('file_start', 'b.yaml'),
+            ('phase_start', 'lint', 'b.yaml'),
+            ('phase_end', 'lint', 'b.yaml'),
+            ('phase_start', 'output', 'b.yaml'),
+            ('phase_end', 'output', 'b.yaml'),
+            ('file_end', 'b.yaml'),
+            ('rule_stats',),
+            ('run_end',),
+            ('run_start',),
+            ('file_start', 'b.yaml'),
+            ('phase_start', 'lint', 'b.yaml'),
+            ('phase_start', 'decode', 'b.yaml'),
+            ('phase_end', 'decode', 'b.yaml'),
+            ('phase_end', 'lint', 'b.yaml'),
+            ('phase_start', 'output', 'b.yaml'),
+            ('phase_end', 'output', 'b.yaml'),
+            ('file_end', 'b.yaml'),
+            ('rule_stats',),
+            ('run_end',)])
+
+        # Statistics of the second run: b.yaml has one hyphen and 3 lines
+        # (trailing-spaces checks them all at once)
+        self.assertEqual(hook.stats['hyphens'][0], 1)
+        self.assertEqual(hook.stats['empty-lines'][0], 3)
+        self.assertEqual(hook.stats['trailing-spaces'][0], 1)
+        self.assertNotIn('key-ordering', hook.stats)
+        self.assertIsInstance(hook.stats['indentation'][1], float)
+
+    def test_plan_without_hooks(self):
+        conf = YamlLintConfig('extends: default')
+        plan = linter.lint_plan(conf, None)
+        self.assertFalse(any(isinstance(rule, hooks.TimedRule)
+                             for rule, _ in plan.token_rules))
+
+        hook = hooks.Hook()
+        hooks.register(hook)
+        try:
+            timed_plan = linter.lint_plan(conf, None)
+        finally:
+            hooks.unregister(hook)
+        self.assertIsNot(timed_plan, plan)
+        self.assertTrue(all(isinstance(rule, hooks.TimedRule)
+                            for rule, _ in timed_plan.token_rules))
+        self.assertIs(linter.lint_plan(conf, None), plan)
+
+    def test_phase_error(self):
+        hook = RecordingHook()
+        hooks.register(hook)
+        try:
+            with self.assertRaises(ValueError), hooks.phase('lint', 'a.yaml'):
+                raise ValueError
+        finally:
+            hooks.unregister(hook)
+        self.assertEqual(hook.calls, [('phase_start', 'lint', 'a.yaml'),
+                                      ('phase_end', 'lint', 'a.yaml')])
+
+    def test_entry_points(self):
+        files = {'site/hook_package-1.0.dist-info/METADATA':
+                 'Metadata-Version: 2.1\nName: hook-package\nVersion: 1.0\n',
+                 'site/hook_package-1.0.dist-info/entry_points.txt':
+                 '[yamllint.hooks]\nrecording = hook_package:Hook\n',
+                 'site/hook_package.py': 'from tests.test_hooks import '
+                                         'RecordingHook as Hook\n'}
+        with temp_workspace(files), \
+                mock.patch.object(hooks, '_hooks', []):
+            hooks.load_entry_points()
+            self.assertFalse(hooks.registered())
+
+            with mock.patch.object(sys, 'path',
+                                   [os.path.abspath('site')] + sys.path):
+                hooks.load_entry_points()
+            self.assertEqual([type(hook).__name__ for hook in hooks._hooks],
+                             ['RecordingHook'])
+            sys.modules.pop('hook_package', None)
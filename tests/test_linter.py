@@ -14,12 +14,69 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import io
+import types
 import unittest
+from unittest import mock
 
-from yamllint import linter
+import yaml
+from tests.common import temp_workspace
+
+from yamllint import linter, parser, rules
 from yamllint.config import YamlLintConfig
 
 
+def check_aliases(conf, event, context):
+    """Event rule that reports aliases, and counts the nodes before them."""
+    if isinstance(event, yaml.DocumentStartEvent):
+        context['nodes'] = 0
+    elif isinstance(event, yaml.AliasEvent):
+        yield linter.LintProblem(event.start_mark.line + 1,
+                                 event.start_mark.column + 1,
+                                 f'alias after {context["nodes"]} nodes')
+    else:
+        context['nodes'] += 1
+
+
+aliases = types.SimpleNamespace(
+    ID='aliases', TYPE='event', CONF={}, DEFAULT={}, check=check_aliases,
+    EVENTS=(yaml.DocumentStartEvent, yaml.NodeEvent))
+
+
+def map_top_level_keys(conf, event, facts):
+    """Project rule that reports top-level keys defined in several files."""
+    facts.setdefault('keys', {})
+    if isinstance(event, yaml.DocumentStartEvent):
+        facts['depth'], facts['nodes'] = 0, 0
+    elif isinstance(event, yaml.CollectionEndEvent):
+        facts['depth'] -= 1
+    elif isinstance(event, yaml.NodeEvent):
+        # Keys and values of the top-level mapping alternate
+        if facts['depth'] == 1:
+            if facts['nodes'] % 2 == 0:
+                facts['keys'].setdefault(event.value, (
+                    event.start_mark.line + 1, event.start_mark.column + 1))
+            facts['nodes'] += 1
+        if isinstance(event, yaml.CollectionStartEvent):
+            facts['depth'] += 1
+
+
+def reduce_top_level_keys(conf, facts):
+    files = {}
+    for filepath, file_facts in sorted(facts.items()):
+        for key in file_facts['keys']:
+            files.setdefault(key, []).append(filepath)
+    for key, filepaths in files.items():
+        for filepath in filepaths[1:]:
+            line, column = facts[filepath]['keys'][key]
+            yield filepath, linter.LintProblem(
+                line, column, f'key "{key}" also defined in {filepaths[0]}')
+
+
+top_level_keys = types.SimpleNamespace(
+    ID='top-level-keys', TYPE='project', CONF={}, DEFAULT={},
+    map=map_top_level_keys, reduce=reduce_top_level_keys)
+
+
 class LinterTestCase(unittest.TestCase):
     def fake_config(self):
         return YamlLintConfig('extends: default')
@@ -55,6 +112,160 @@ class LinterTestCase(unittest.TestCase):
         linter.run(s, self.fake_config())
         linter.run(s.encode('utf-8'), self.fake_config())
 
+    def test_syntax_checker(self):
+        tokens = parser.token_stream('---\n'
+                                     'a: 1\n'
+                                     'b: 2\n'
+                                     'c: [3\n'
+                                     'd: 4\n')
+        syntax_checker = linter.SyntaxChecker(tokens)
+        self.assertIsNone(syntax_checker.error_until(2))
+        self.assertEqual(tokens.last.start_mark.line, 2)
+        self.assertEqual(repr(syntax_checker.error_until()),
+                         "5:2: syntax error: expected ',' or ']', but got "
+                         "':' (syntax)")
+
+    def test_directive_pointers(self):
+        buffer = ('# yamllint disable rule:colons\n'
+                  'key:  "# yamllint enable"  # yamllint disable-line\n'
+                  'other:  value   \n')
+        self.assertEqual(linter.directive_pointers(buffer), {0, 38, 58})
+        self.assertEqual(linter.directive_pointers(buffer, 31), {38, 58})
+        self.assertEqual(linter.directive_pointers('key: value\n'), set())
+        self.assertEqual(
+            list(linter.run(buffer, self.fake_config())),
+            [linter.LintProblem(3, 14, rule='trailing-spaces')])
+
+    def test_lint_plan(self):
+        conf = YamlLintConfig('extends: default\n'
+                              'rules:\n'
+                              '  truthy:\n'
+                              '    ignore: "*.generated.yaml"\n')
+        plan = linter.lint_plan(conf, 'a.yaml')
+        self.assertIs(linter.lint_plan(conf, 'dir/b.yaml'), plan)
+        self.assertIsNot(linter.lint_plan(conf, 'c.generated.yaml'), plan)
+        self.assertIn('truthy', plan.rule_ids)
+        self.assertNotIn(
+            'truthy', linter.lint_plan(conf, 'c.generated.yaml').rule_ids)
+
+        hyphens = [rule.ID for rule, _ in
+                   plan.token_rules_for(yaml.BlockEntryToken)]
+        self.assertIn('hyphens', hyphens)
+        self.assertIn('indentation', hyphens)
+        self.assertNotIn('hyphens', [rule.ID for rule, _ in
+                                     plan.token_rules_for(yaml.KeyToken)])
+
+    def test_lint_plan_changed_conf(self):
+        conf = YamlLintConfig('extends: default')
+        buffer = '---\nkey: ' + 'x' * 90 + '  \n'
+        self.assertEqual([p.rule for p in linter.run(buffer, conf)],
+                         ['line-length', 'trailing-spaces'])
+
+        conf.rules['line-length'] = {**conf.rules['line-length'],
+                                     'max': 120}
+        conf.rules['trailing-spaces'] = False
+        self.assertEqual(list(linter.run(buffer, conf)), [])
+
+        conf.rules['line-length']['max'] = 50
+        self.assertEqual([p.desc for p in linter.run(buffer, conf)],
+                         ['line too long (97 > 50 characters)'])
+
+        with mock.patch.dict(rules._RULES, {'line-length': rules.truthy}):
+            self.assertEqual(list(linter.run(buffer, conf)), [])
+
+    def test_lint_plan_features(self):
+        conf = YamlLintConfig('extends: default\n'
+                              'rules:\n'
+                              '  quoted-strings:\n'
+                              '    required: only-when-needed\n')
+        plan = linter.lint_plan(conf, None,
+                                parser.buffer_features('key: value\n'))
+        self.assertEqual(
+            {'anchors', 'braces', 'brackets', 'commas', 'comments',
+             'comments-indentation', 'octal-values', 'quoted-strings'} &
+            plan.rule_ids, set())
+        self.assertIn('indentation', plan.rule_ids)
+        self.assertIs(linter.lint_plan(conf, None,
+                                       parser.buffer_features('a: b\n')),
+                      plan)
+        self.assertIsNot(linter.lint_plan(conf, None), plan)
+
+        plan = linter.lint_plan(conf, None,
+                                parser.buffer_features('- &a "b"\n- *a\n'))
+        self.assertIn('anchors', plan.rule_ids)
+        self.assertIn('quoted-strings', plan.rule_ids)
+        self.assertNotIn('brackets', plan.rule_ids)
+
+        # Unquoted strings are reported when quotes are required
+        conf = YamlLintConfig('rules:\n'
+                              '  quoted-strings: enable\n')
+        self.assertIn('quoted-strings', linter.lint_plan(
+            conf, None, parser.buffer_features('key: value\n')).rule_ids)
+
+    def test_no_warnings(self):
+        conf = YamlLintConfig('extends: default\n'
+                              'rules:\n'
+                              '  trailing-spaces: {level: warning}\n')
+        self.assertNotIn('truthy', linter.lint_plan(
+            conf, None, no_warnings=True).rule_ids)
+
+        with mock.patch.object(rules.truthy, 'check') as check:
+            problems = list(linter.run('key: yes  \nother:  no\n', conf,
+                                       no_warnings=True))
+        check.assert_not_called()
+        self.assertEqual([(p.line, p.rule) for p in problems],
+                         [(2, 'colons')])
+
+        # The syntax error replaces the warning after it, not the error
+        for buffer in ('...\na: 1\na: 2\n',
+                       'key: yes  \nother:  no\n',
+                       '---\nkey: [yes,  no\n---\na: 1\na: 2\n'):
+            self.assertEqual(
+                [(p.line, p.column, p.rule) for p in
+                 linter.run(buffer, conf, no_warnings=True)],
+                [(p.line, p.column, p.rule) for p in
+                 linter.run(buffer, conf) if p.level == 'error'])
+            self.assertEqual(
+                [(p.line, p.column, p.rule) for p in
+                 linter.run_stream(io.StringIO(buffer), conf, chunk_size=4,
+                                   no_warnings=True)],
+                [(p.line, p.column, p.rule) for p in
+                 linter.run(buffer, conf) if p.level == 'error'])
+
+    def test_event_rule(self):
+        buffer = ('---\n'
+                  'a: &x 1\n'
+                  'b: *x  # yamllint disable-line rule:aliases\n'
+                  'c: [*x,\n'
+                  '    *x]\n'
+                  '---\n'
+                  '- &y 2\n'
+                  '- *y\n'
+                  '- [\n')
+        with mock.patch.dict(rules._RULES, {'aliases': aliases}):
+            conf = YamlLintConfig('extends: default\n'
+                                  'rules:\n'
+                                  '  aliases: enable\n')
+            plan = linter.lint_plan(conf, None)
+            self.assertEqual(plan.event_rules,
+                             [(aliases, conf.rules['aliases'])])
+            problems = list(linter.run(buffer, conf))
+            self.assertEqual(
+                [(p.line, p.column, p.rule, p.desc) for p in problems],
+                [(4, 5, 'aliases', 'alias after 6 nodes'),
+                 (5, 5, 'aliases', 'alias after 6 nodes'),
+                 (8, 3, 'aliases', 'alias after 2 nodes'),
+                 (10, 1, None, 'syntax error: expected the node content, '
+                  "but found '<stream end>' (syntax)")])
+
+            # Documents are parsed separately, events are the same
+            for other in (linter.DocumentCache(conf).run(buffer),
+                          linter.run_stream(io.StringIO(buffer), conf,
+                                            chunk_size=1)):
+                self.assertEqual(
+                    [(p.line, p.column, p.rule, p.desc) for p in other],
+                    [(p.line, p.column, p.rule, p.desc) for p in problems])
+
     def test_linter_problem_repr_without_rule(self):
         problem = linter.LintProblem(1, 2, 'problem')
 
@@ -64,3 +275,373 @@ class LinterTestCase(unittest.TestCase):
         problem = linter.LintProblem(1, 2, 'problem', 'rule-id')
 
         self.assertEqual(str(problem), '1:2: problem (rule-id)')
+
+    def test_linter_problem_lazy_desc(self):
+        calls = []
+        problem = linter.LintProblem(1, 2, lambda: calls.append(1) or 'lazy',
+                                     'rule-id')
+        self.assertEqual(calls, [])
+        self.assertEqual(problem.desc, 'lazy')
+        self.assertEqual(problem.message, 'lazy (rule-id)')
+        self.assertEqual(calls, [1])
+
+
+class RunProjectTestCase(unittest.TestCase):
+    def test_run_project(self):
+        files = {'a.yaml': 'key: 1\nother: {key: 2}\n',
+                 'b.yaml': '---\nlist: []\nkey: 3\n',
+                 'c.yaml': '# yamllint disable-file\nkey: 4\n',
+                 'd.yaml': 'list: [\n',
+                 'e.yaml': 'key: 6\n'}
+        with mock.patch.dict(rules._RULES,
+                             {'top-level-keys': top_level_keys}), \
+                temp_workspace(files):
+            conf = YamlLintConfig('rules:\n'
+                                  '  top-level-keys:\n'
+                                  '    ignore: e.yaml\n')
+            cache = {}
+            problems = linter.run_project(sorted(files), conf, cache=cache)
+            self.assertEqual(
+                {filepath: [(p.line, p.column, p.rule, p.desc)
+                            for p in file_problems]
+                 for filepath, file_problems in problems.items()},
+                {'a.yaml': [],
+                 'b.yaml': [(3, 1, 'top-level-keys',
+                             'key "key" also defined in a.yaml')],
+                 'c.yaml': [],
+                 'd.yaml': [(1, 1, 'top-level-keys',
+                             'key "list" also defined in b.yaml')],
+                 'e.yaml': []})
+
+            # Only modified files are read again
+            self.assertEqual(set(cache), set(files))
+            cache['a.yaml'] = (cache['a.yaml'][0], {'top-level-keys': {
+                'keys': {}}}, cache['a.yaml'][2])
+            with open('d.yaml', 'w', encoding='utf-8') as f:
+                f.write('---\nkey: 5\n')
+            problems = linter.run_project(sorted(files), conf, cache=cache)
+            self.assertEqual(
+                [(p.line, p.desc) for p in problems['d.yaml']],
+                [(2, 'key "key" also defined in b.yaml')])
+
+    def test_directives(self):
+        files = {'a.yaml': 'key: 1\nlist: []\nother: 2\n',
+                 'b.yaml': '# yamllint disable rule:top-level-keys\n'
+                           'key: 2\n'
+                           '# yamllint enable\n'
+                           'list: [1]  # yamllint disable-line\n'
+                           'other: 3\n'}
+        with mock.patch.dict(rules._RULES,
+                             {'top-level-keys': top_level_keys}), \
+                temp_workspace(files):
+            conf = YamlLintConfig('rules:\n  top-level-keys: enable\n')
+            problems = linter.run_project(sorted(files), conf)
+        self.assertEqual(
+            {filepath: [(p.line, p.column, p.rule)
+                        for p in file_problems]
+             for filepath, file_problems in problems.items()},
+            {'a.yaml': [], 'b.yaml': [(5, 1, 'top-level-keys')]})
+
+    def test_unknown_files(self):
+        def reduce(conf, facts):
+            yield 'a.yaml', linter.LintProblem(1, 1, 'in a linted file')
+            yield 'other.yaml', linter.LintProblem(1, 1, 'somewhere else')
+
+        rule = types.SimpleNamespace(
+            ID='files', TYPE='project', CONF={}, DEFAULT={},
+            map=lambda conf, event, facts: None, reduce=reduce)
+        with mock.patch.dict(rules._RULES, {'files': rule}), \
+                temp_workspace({'a.yaml': 'key: 1\n'}):
+            conf = YamlLintConfig('rules:\n  files: enable\n')
+            problems = linter.run_project(['a.yaml'], conf)
+        self.assertEqual(
+            {filepath: [p.desc for p in file_problems]
+             for filepath, file_problems in problems.items()},
+            {'a.yaml': ['in a linted file']})
+
+    def test_no_project_rules(self):
+        self.assertEqual(
+            linter.run_project(['missing.yaml'],
+                               YamlLintConfig('extends: default')),
+            {'missing.yaml': []})
+
+
+class DocumentCacheTestCase(unittest.TestCase):
+    conf = YamlLintConfig('extends: default\n'
+                          'rules:\n'
+                          '  anchors: {forbid-unused-anchors: true}\n'
+                          '  key-ordering: enable\n')
+
+    def assertSameProblems(self, cache, buffer):
+        self.assertEqual(
+            [(p.line, p.column, p.rule, p.desc, p.level)
+             for p in cache.run(buffer)],
+            [(p.line, p.column, p.rule, p.desc, p.level)
+             for p in linter.run(buffer, self.conf)])
+
+    def test_same_problems(self):
+        for buffer in (
+                '',
+                'key: value   \n',
+                '# comment\n---\na: 1\n---\nb: yes\n',
+                '---\na:\n    b: 1\n---\nc:\n  d: 2\n',
+                '---\n&a x: 1\n--- # comment\n*a\n---\nk: &b v\n',
+                '---\nb: 1\na: 2\n---\nb: 1\na: 2 \n',
+                '# yamllint disable rule:trailing-spaces\n'
+                '---\na: 1 \n---\nb: 1 \n# yamllint enable\n---\nc: 1 \n',
+                '---\na: 1\n# yamllint disable-line rule:document-start\n'
+                '---\n',
+                '%YAML 1.2\n---\ntrue: yes\n---\nkey: [1,\n---\n2]\n',
+                '---\n"quoted\n---\nstring"\n---\na: b\n',
+                '---\nkey: |\n  text\n---\n- [a\n---\n- b\n',
+                '---\na: " "\n---\nb: 1\n',
+                '---\n- a\n  - b\n---\nc:\n',
+                '---\n- a\n---\n',
+                '---\nx\n...\n---\ny\n--- \t\nz',
+                '---\na: 1\n\n\n\n---\n\n\nb: 1\n\n\n',
+                # Syntax errors in documents before the last one
+                '---\na: 1\n---\nk: >#\n  text\n---\nb: 2\n',
+                '|#\n---\n*b\n-',
+                '---\na: 1\n---\nkey: [a\n---\nb: 2\n---\nc: 3\n',
+                '---\nk:\tv\n---\nb: 1\n',
+                ']\n---\n"a\n---\nb: 1\n',
+                # Rules fail on the segment alone
+                'key: value\n]\n--- |\n  lit\n---\nb: 1\n'):
+            # Documents linted alone, and together
+            for group_size in (0, 1024):
+                with mock.patch('yamllint.linter.CACHE_GROUP_SIZE',
+                                group_size):
+                    self.assertSameProblems(linter.DocumentCache(self.conf),
+                                            buffer)
+
+    def test_open_end(self):
+        # After an unclosed flow collection, the rest of the source is linted
+        # at once, not merged with the next documents one by one
+        cache = linter.DocumentCache(self.conf)
+        document = '---\nkey: value\nlist:\n  - a\n  - b\n'
+        with mock.patch('yamllint.linter.CACHE_GROUP_SIZE', 0):
+            self.assertSameProblems(
+                cache, document * 3 + '---\nkey: [a\n' + document * 100)
+        self.assertLess(cache.linted, 10)
+
+    def test_groups(self):
+        cache = linter.DocumentCache(self.conf)
+        buffer = ''.join(f'---\nkey{i}: &a{i} value\nlist:\n  - *a{i}\n'
+                         for i in range(200))
+        self.assertSameProblems(cache, buffer)
+        self.assertLess(cache.linted, 50)
+
+        # Groups after the edited one are the same
+        buffer = buffer.replace('key100: ', 'key100:  ')
+        self.assertSameProblems(cache, buffer)
+        self.assertLessEqual(cache.linted, 2)
+
+    @mock.patch('yamllint.linter.CACHE_GROUP_SIZE', 0)
+    def test_reuse(self):
+        cache = linter.DocumentCache(self.conf)
+        buffer = ''.join(f'---\nkey{i}: &a{i} value\nlist:\n  - *a{i}\n'
+                         for i in range(10))
+        self.assertSameProblems(cache, buffer)
+        self.assertEqual(cache.linted, 10)
+
+        # Only the edited document is linted again, other problems move
+        buffer = buffer.replace('key3: ', 'key3:  \n\nnew:   ')
+        self.assertSameProblems(cache, buffer)
+        self.assertEqual(cache.linted, 1)
+
+        # Indentation detected in the first document changes the next ones
+        buffer = buffer.replace('  - *a0', '    - *a0')
+        self.assertSameProblems(cache, buffer)
+        self.assertEqual(cache.linted, 10)
+
+        self.assertSameProblems(cache, buffer)
+        self.assertEqual(cache.linted, 0)
+
+    @mock.patch('yamllint.linter.CACHE_GROUP_SIZE', 0)
+    def test_edit(self):
+        cache = linter.DocumentCache(self.conf)
+        buffer = ''.join(f'---\nkey{i}: &a{i} value\nlist:\n  - *a{i}\n'
+                         for i in range(10))
+        cache.run(buffer)
+        for old, new, linted in (
+                ('key3: ', 'key3:  \n\nnew:   ', 1),
+                # New document start
+                ('key5: &a5 value\n', 'key5: &a5 value\n---\n', 2),
+                ('---\nkey9', '---   \nkey9', 1),
+                # Removed document start
+                ('---   \nkey9', 'key9', 1),
+                # Indentation detected in the first document changes the
+                # next ones
+                ('  - *a0', '    - *a0', 10),
+                ('', '# yamllint disable-file\n', 0)):
+            start = buffer.index(old)
+            buffer = buffer[:start] + new + buffer[start + len(old):]
+            cache.edit(start, start + len(old), new)
+            self.assertEqual(cache.buffer, buffer)
+            self.assertEqual(
+                [(p.line, p.column, p.rule, p.desc, p.level)
+                 for p in cache.run()],
+                [(p.line, p.column, p.rule, p.desc, p.level)
+                 for p in linter.run(buffer, self.conf)])
+            self.assertEqual(cache.linted, linted)
+
+    def test_disable_file(self):
+        cache = linter.DocumentCache(self.conf)
+        self.assertEqual(cache.run('# yamllint disable-file\n---\na:  1\n'),
+                         [])
+
+
+class RunStreamTestCase(unittest.TestCase):
+    conf = DocumentCacheTestCase.conf
+
+    def assertSameProblems(self, buffer, chunk_size):
+        self.assertEqual(
+            [(p.line, p.column, p.rule, p.desc, p.level)
+             for p in linter.run_stream(io.BytesIO(buffer.encode('utf-8')),
+                                        self.conf, chunk_size=chunk_size)],
+            [(p.line, p.column, p.rule, p.desc, p.level)
+             for p in linter.run(buffer, self.conf)])
+
+    def test_same_problems(self):
+        for buffer in (
+                '',
+                'key: value   ',
+                '---\na: 1\n---\nb: yes\n---\nc:  ☺\n' * 20,
+                '---\n&a x: 1\n--- # comment\n*a\n---\nk: &b v\n',
+                '# yamllint disable rule:trailing-spaces\n'
+                '---\na: 1 \n---\nb: 1 \n# yamllint enable\n---\nc: 1 \n',
+                '%YAML 1.2\n---\ntrue: yes\n---\nkey: [1,\n---\n2]\n',
+                '---\n"quoted\n---\nstring"\n---\na: b\n',
+                '---\nx\n...\n---\ny\n--- \t\nz',
+                '---\na: 1\n\n\n\n---\n\n\nb: 1\n\n\n',
+                # The last segment must be linted with the previous ones
+                '---\na: 1\n---\nb: [1]\n--- # c\n---\n"quoted\n---\nc:\n',
+                # After ']', '|' can't start a token: rules fail on the first
+                # segment alone
+                'key:    value\nkey: value   \n]\n--- |\n  lit\n   \n'
+                'o: 010\n{a: 1, b: [2, 3]}\nlong: ' + 'x' * 90 + '\n'
+                '---\r\n# yamllint enable\n'):
+            for chunk_size in (1, 5, 16, 64, 4096):
+                self.assertSameProblems(buffer, chunk_size)
+
+    def test_syntax_errors(self):
+        # Errors in documents before the last one, in streams larger than
+        # the segments linted together
+        document = '---\nkey: value\nlist:\n  - a\n  - b\n'
+        for error in ('---\nkey: [a\n', '---\n{a: 1,\n', '---\nk: "a\n',
+                      '---\nk: >#\n  text\n', '---\n- |#\n',
+                      '---\nk:\tv\n', '---\na: b\u2028c\n',
+                      # The scanner error after the document start hides the
+                      # token before it from the rules
+                      ']\n---\n"a\n'):
+            buffer = document * 10 + error + document * 30
+            for chunk_size in (64, 4096):
+                self.assertSameProblems(buffer, chunk_size)
+
+    def test_open_end(self):
+        # After an unclosed flow collection, the rest of the stream is linted
+        # at once, not merged with the next documents one by one
+        document = '---\nkey: value\nlist:\n  - a\n  - b\n'
+        buffer = document * 3 + '---\nkey: [a\n' + document * 100
+        with mock.patch('yamllint.linter._lint_segment',
+                        wraps=linter._lint_segment) as lint_segment:
+            self.assertSameProblems(buffer, 64)
+        self.assertLess(lint_segment.call_count, 10)
+
+    def test_disable_file(self):
+        self.assertEqual(
+            list(linter.run_stream(io.StringIO('# yamllint disable-file\n'
+                                               '---\na:  1\n'),
+                                   self.conf, chunk_size=1)),
+            [])
+
+
+class RunParallelTestCase(unittest.TestCase):
+    conf = DocumentCacheTestCase.conf
+
+    def assertSameProblems(self, buffer):
+        with mock.patch('yamllint.linter.PARALLEL_PART_SIZE', 1):
+            problems = linter.run_parallel(buffer, self.conf, jobs=2)
+        self.assertEqual(
+            [(p.line, p.column, p.rule, p.desc, p.level) for p in problems],
+            [(p.line, p.column, p.rule, p.desc, p.level)
+             for p in linter.run(buffer, self.conf)])
+
+    def test_same_problems(self):
+        for buffer in (
+                '',
+                'key: value   \n',
+                '---\na: 1\n---\nb: yes\n---\nc:  1\n' * 5,
+                '---\n&a x: 1\n--- # comment\n*a\n---\nk: &b v\n',
+                # Parts don't start in the state of the document before them
+                '# yamllint disable rule:trailing-spaces\n'
+                '---\na: 1 \n---\nb: 1 \n# yamllint enable\n---\nc: 1 \n',
+                '---\na:\n    b: 1\n---\nc: 1\n---\nd:\n  e: 2\n',
+                # Parts can't be linted on their own
+                '%YAML 1.2\n---\ntrue: yes\n---\nkey: [1,\n---\n2]\n',
+                '---\n"quoted\n---\nstring"\n---\na: b\n',
+                '---\na: 1\n\n\n\n---\n\n\nb: 1\n\n\n',
+                '---\nkey: value\n]\n--- |\n  lit\n---\nb: 1\n'):
+            self.assertSameProblems(buffer)
+
+    def test_disable_file(self):
+        self.assertEqual(
+            linter.run_parallel('# yamllint disable-file\n---\na:  1\n',
+                                self.conf, jobs=2),
+            [])
+
+    def test_no_warnings(self):
+        for buffer in ('---\na: yes\n---\nb:  1\n---\nc: 1\n',
+                       '---\na: yes\n---\nb: [1\n---\nc:  1\n'):
+            with mock.patch('yamllint.linter.PARALLEL_PART_SIZE', 1):
+                problems = linter.run_parallel(buffer, self.conf, jobs=2,
+                                               no_warnings=True)
+            self.assertEqual(
+                [(p.line, p.column, p.rule) for p in problems],
+                [(p.line, p.column, p.rule) for p in
+                 linter.run(buffer, self.conf) if p.level == 'error'])
+
+
+class RunSyntaxTestCase(unittest.TestCase):
+    conf = DocumentCacheTestCase.conf
+
+    def assertSameProblems(self, buffer):
+        expected = [(p.line, p.column, p.desc, p.level)
+                    for p in linter.run(buffer, self.conf)
+                    if p.rule is None]
+        self.assertEqual([(p.line, p.column, p.desc, p.level)
+                          for p in linter.run_syntax(buffer, self.conf)],
+                         expected)
+
+    def test_same_problems(self):
+        for buffer in (
+                '',
+                'key: value   \n',
+                '---\nkey: [1,\n---\n2]\n',
+                '{\n  key: value\n  other: value\n}\n',
+                # Documents that libyaml and PyYAML don't parse the same
+                '%YAML 1.2\n---\ntrue: yes\n',
+                '%FOO bar\n--- "foo"\n',
+                'key:\t|\n  text\n',
+                '- >\n \t\n detected\n',
+                '{\n  foo : !!str,\n  !!str : bar,\n}\n',
+                '? key\n: v\n﻿',
+                'key: >#\n  text\n',
+                '- |-2#\n  text\n',
+                '---\n[a\n  ? b]\n',
+                '[a\n? b]\n'):
+            self.assertSameProblems(buffer)
+
+    def test_input_types(self):
+        self.assertEqual(
+            len(linter.run_syntax(b'key: [value\n', self.conf)), 1)
+        self.assertEqual(
+            len(linter.run_syntax(io.StringIO('key: [value\n'), self.conf)),
+            1)
+        self.assertRaises(TypeError, linter.run_syntax, 1, self.conf)
+
+    def test_disable_file(self):
+        self.assertEqual(
+            linter.run_syntax('# yamllint disable-file\nkey: [value\n',
+                              self.conf),
+            [])
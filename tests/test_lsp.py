@@ -0,0 +1,203 @@
+# Copyright (C) 2026 agent
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import io
+import unittest
+from unittest import mock
+
+from yamllint import lsp
+from yamllint.config import YamlLintConfig
+
+
+def request(id, method, params=None):
+    return {'jsonrpc': '2.0', 'id': id, 'method': method,
+            'params': params or {}}
+
+
+def notification(method, params=None):
+    return {'jsonrpc': '2.0', 'method': method, 'params': params or {}}
+
+
+def position(line, character):
+    return {'line': line, 'character': character}
+
+
+class LanguageServerTestCase(unittest.TestCase):
+    def serve(self, *messages):
+        input, output = io.BytesIO(), io.BytesIO()
+        for message in messages:
+            lsp.write_message(input, message)
+        input.seek(0)
+        server = lsp.LanguageServer(YamlLintConfig('extends: default'),
+                                    input, output)
+        returncode = server.serve()
+        output.seek(0)
+        return returncode, list(iter(lambda: lsp.read_message(output), None))
+
+    def test_lifecycle(self):
+        returncode, responses = self.serve(
+            request(1, 'initialize', {'capabilities': {}}),
+            notification('initialized'),
+            request(2, 'unknown/method'),
+            request(3, 'shutdown'),
+            notification('exit'))
+        self.assertEqual(returncode, 0)
+        self.assertEqual(responses[0]['id'], 1)
+        self.assertEqual(
+            responses[0]['result']['capabilities']['textDocumentSync'],
+            {'openClose': True, 'change': 2})
+        self.assertEqual(responses[1]['id'], 2)
+        self.assertEqual(responses[1]['error']['code'], -32601)
+        self.assertEqual(responses[2], {'jsonrpc': '2.0', 'id': 3,
+                                        'result': None})
+
+        returncode, responses = self.serve(notification('exit'))
+        self.assertEqual(returncode, 1)
+
+    def test_cancel_request(self):
+        returncode, responses = self.serve(
+            request(1, 'shutdown'),
+            notification('$/cancelRequest', {'id': 1}),
+            notification('exit'))
+        self.assertEqual(returncode, 1)
+        self.assertEqual(responses[0]['error']['code'], -32800)
+
+    def test_invalid_messages(self):
+        uri = 'file:///tmp/file.yaml'
+        returncode, responses = self.serve(
+            notification('$/cancelRequest'),
+            notification('$/cancelRequest', {}),
+            notification('textDocument/didOpen'),
+            notification('textDocument/didOpen', {'textDocument': {
+                'uri': uri, 'version': 1, 'text': 'a: 1\n'}}),
+            notification('textDocument/didChange', {
+                'textDocument': {'uri': uri, 'version': 2},
+                'contentChanges': [{'range': {'start': position(9, 0)},
+                                    'text': 'b: 2\n'}]}),
+            request(1, 'shutdown'),
+            notification('exit'))
+        self.assertEqual(returncode, 0)
+        self.assertEqual(
+            [(response.get('method'), response.get('id'))
+             for response in responses],
+            [('window/logMessage', None), ('window/logMessage', None),
+             (None, 1)])
+        self.assertEqual(
+            responses[0]['params'],
+            {'type': 1, 'message': "textDocument/didOpen failed: KeyError: "
+                                   "'textDocument'"})
+        self.assertEqual(responses[1]['params']['message'],
+                         "textDocument/didChange failed: KeyError: 'end'")
+
+    def test_request_failure(self):
+        output = io.BytesIO()
+        server = lsp.LanguageServer(YamlLintConfig('extends: default'),
+                                    io.BytesIO(), output)
+        server.handlers['test/fail'] = mock.Mock(side_effect=ValueError('x'))
+        server.handle(request(1, 'test/fail'), set())
+        server.handle(request(2, 'shutdown'), set())
+        output.seek(0)
+        self.assertEqual(
+            list(iter(lambda: lsp.read_message(output), None)),
+            [{'jsonrpc': '2.0', 'id': 1,
+              'error': {'code': -32603,
+                        'message': 'test/fail failed: ValueError: x'}},
+             {'jsonrpc': '2.0', 'id': 2, 'result': None}])
+
+    def test_diagnostics(self):
+        output = io.BytesIO()
+        server = lsp.LanguageServer(YamlLintConfig('extends: default'),
+                                    io.BytesIO(), output)
+        uri = 'file:///tmp/file.yaml'
+        for message in (
+                notification('textDocument/didOpen', {'textDocument': {
+                    'uri': uri, 'languageId': 'yaml', 'version': 1,
+                    'text': '---\nkey: value   \n---\nother: value\n'}}),
+                notification('textDocument/didChange', {
+                    'textDocument': {'uri': uri, 'version': 2},
+                    'contentChanges': [
+                        {'range': {'start': position(1, 10),
+                                   'end': position(1, 13)},
+                         'text': ''},
+                        {'range': {'start': position(3, 0),
+                                   'end': position(3, 0)},
+                         'text': '\U0001f600:  x\n'}]})):
+            server.handle(message, set())
+        server.publish_diagnostics()
+        server.handle(notification('textDocument/didClose', {
+            'textDocument': {'uri': uri}}), set())
+
+        output.seek(0)
+        self.assertEqual(
+            [message['params']
+             for message in iter(lambda: lsp.read_message(output), None)],
+            [{'uri': uri, 'version': 2, 'diagnostics': [{
+                'range': {'start': position(3, 4), 'end': position(3, 4)},
+                'severity': 1, 'source': 'yamllint',
+                'message': 'too many spaces after colon',
+                'code': 'colons'}]},
+             {'uri': uri, 'diagnostics': []}])
+        self.assertEqual(server.documents, {})
+
+    def test_edits(self):
+        document = lsp.Document('untitled:1', '---\na: 1\n---\nb: 2\n', 1,
+                                YamlLintConfig('extends: default'))
+        self.assertEqual(document.diagnostics(), [])
+        self.assertEqual(document.cache.linted, 2)
+        document.change({'range': {'start': position(3, 4),
+                                   'end': position(3, 4)},
+                         'text': '  '})
+        self.assertEqual(
+            [(d['range']['start'], d['code'])
+             for d in document.diagnostics()],
+            [(position(3, 4), 'trailing-spaces')])
+        self.assertEqual(document.cache.linted, 1)
+
+    def test_lint_failure(self):
+        document = lsp.Document('untitled:1', '---\na: 1\n---\nb: 2\n', 1,
+                                YamlLintConfig('extends: default'))
+        with mock.patch.object(document.cache, 'run',
+                               side_effect=TypeError('unexpected token')):
+            self.assertEqual(document.diagnostics(), [{
+                'range': {'start': position(0, 0), 'end': position(0, 0)},
+                'severity': 1, 'source': 'yamllint',
+                'message': 'linting failed: TypeError: unexpected token'}])
+        document.change({'range': {'start': position(3, 4),
+                                   'end': position(3, 4)},
+                         'text': '  '})
+        self.assertEqual(
+            [(d['range']['start'], d['code'])
+             for d in document.diagnostics()],
+            [(position(3, 4), 'trailing-spaces')])
+
+    def test_offset(self):
+        document = lsp.Document('untitled:1', 'a\r\nb\U0001f600c\rd', 1,
+                                YamlLintConfig('extends: default'))
+        self.assertEqual(document.offset(position(0, 1)), 1)
+        self.assertEqual(document.offset(position(1, 1)), 4)
+        self.assertEqual(document.offset(position(1, 3)), 5)
+        self.assertEqual(document.offset(position(1, 9)), 6)
+        self.assertEqual(document.offset(position(2, 1)), 8)
+        self.assertEqual(document.offset(position(5, 0)), 8)
+
+    def test_reversed_range(self):
+        document = lsp.Document('untitled:1', '---\na: 1\nb: 2\n', 1,
+                                YamlLintConfig('extends: default'))
+        self.assertEqual(document.diagnostics(), [])
+        document.change({'range': {'start': position(2, 0),
+                                   'end': position(1, 0)},
+                         'text': 'c: 3\n'})
+        self.assertEqual(document.text, '---\na: 1\nc: 3\nb: 2\n')
+        self.assertEqual(document.cache.buffer, document.text)
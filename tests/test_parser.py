@@ -20,8 +20,14 @@ import yaml
 from yamllint.parser import (
     Comment,
     Line,
+    LineIndex,
+    Nesting,
+    Segment,
     Token,
+    buffer_features,
     line_generator,
+    line_index,
+    token_stream,
     token_or_comment_generator,
     token_or_comment_or_line_generator,
 )
@@ -66,6 +72,54 @@ class ParserTestCase(unittest.TestCase):
         self.assertEqual(e[2].line_no, 3)
         self.assertEqual(e[2].content, 'at the end')
 
+    def test_line_generator_window(self):
+        buffer = 'a\r\n\nb: c\n'
+        window = Line(None, None, None, None)
+        e = []
+        for line in line_generator(buffer, window=window):
+            self.assertIs(line, window)
+            e.append((line.line_no, line.start, line.end, line.content))
+        self.assertEqual(e, [(line.line_no, line.start, line.end, line.content)
+                             for line in line_generator(buffer)])
+        self.assertEqual(e, [(1, 0, 1, 'a'), (2, 3, 3, ''), (3, 4, 8, 'b: c'),
+                             (4, 9, 9, '')])
+
+    def test_line_index(self):
+        index = LineIndex('a\n  b\r\n\n   \n')
+        self.assertEqual(list(index.starts), [0, 2, 7, 8, 12])
+        self.assertEqual([index.line_no(pointer) for pointer in range(13)],
+                         [1, 1, 2, 2, 2, 2, 2, 3, 4, 4, 4, 4, 5])
+        self.assertEqual([index.indent(line_no) for line_no in range(1, 6)],
+                         [0, 2, 0, 3, 0])
+        self.assertEqual(index.start(4), 8)
+
+        # Lines of a range of the buffer only
+        index = LineIndex('a\n  b\r\n\n   \nc', 4, 8, 2)
+        self.assertEqual(list(index.starts), [2, 7, 8])
+        self.assertEqual(index.line_no(7), 3)
+        self.assertEqual(index.indent(2), 2)
+
+        # Tokens of a stream share the index of its lines
+        buffer = 'a: 1\n---\nkey:\n  value\n'
+        segment = Segment(buffer, 5, len(buffer), 1, 2, first=False)
+        tokens = token_stream(buffer, segment)
+        reader = tokens.reader()
+        marks = [reader.get_token().start_mark for _ in range(7)]
+        self.assertIs(line_index(marks[0]), line_index(marks[-1]))
+        self.assertEqual(list(line_index(marks[0]).starts), [5, 9, 14, 22])
+        self.assertEqual(line_index(marks[-1]).line_no(marks[-1].pointer), 4)
+
+        # Other marks only index their line
+        mark = yaml.Mark(None, 16, 3, 2, buffer, 16)
+        self.assertEqual(list(line_index(mark).starts), [14])
+        self.assertEqual(line_index(mark).indent(4), 2)
+
+    def test_buffer_features(self):
+        self.assertEqual(buffer_features(''), frozenset())
+        self.assertEqual(buffer_features('key: value\n'), frozenset())
+        self.assertEqual(buffer_features('a: [&b 10, "c"]  # d\n'),
+                         frozenset('[&0,"]#'))
+
     def test_token_or_comment_generator(self):
         e = list(token_or_comment_generator(''))
         self.assertEqual(len(e), 2)
@@ -140,6 +194,39 @@ class ParserTestCase(unittest.TestCase):
         self.assertFalse(e[8].is_inline())
         self.assertTrue(e[9].is_inline())
 
+        e = [c for c in
+             token_or_comment_generator('key: "#"  # a # b\n'
+                                        '  # c\r\n'
+                                        'list: [a, # d\n'
+                                        '       b]  #\n')
+             if isinstance(c, Comment)]
+        self.assertEqual([(c.line_no, c.column_no, str(c)) for c in e],
+                         [(1, 11, '# a # b'), (2, 3, '# c\r'),
+                          (3, 11, '# d'), (4, 12, '#')])
+        self.assertIs(str(e[0]), str(e[0]))
+        self.assertIs(e[1].comment_before, e[0])
+
+    def test_token_or_comment_generator_window(self):
+        def position(token):
+            return token and (type(token), token.start_mark.pointer)
+
+        buffer = '---\nk: [v]  # comment\n'
+        tokens = [(e.line_no, position(e.curr), position(e.prev),
+                   position(e.next), position(e.nextnext))
+                  for e in token_or_comment_generator(buffer)
+                  if isinstance(e, Token)]
+
+        window = Token(None, None, None, None, None)
+        e = []
+        for elem in token_or_comment_generator(buffer, window=window):
+            if isinstance(elem, Token):
+                self.assertIs(elem, window)
+                e.append((elem.line_no, position(elem.curr),
+                          position(elem.prev), position(elem.next),
+                          position(elem.nextnext)))
+        self.assertEqual(len(e), 11)
+        self.assertEqual(e, tokens)
+
     def test_token_or_comment_or_line_generator(self):
         e = list(token_or_comment_or_line_generator('---\n'
                                                     'k: v  # k=v\n'))
@@ -155,3 +242,69 @@ class ParserTestCase(unittest.TestCase):
         self.assertIsInstance(e[8], Comment)
         self.assertIsInstance(e[9], Line)
         self.assertIsInstance(e[12], Line)
+
+    def test_token_stream(self):
+        tokens = token_stream('a: [b, c]\n')
+        reader1, reader2 = tokens.reader(), tokens.reader()
+        self.assertIsInstance(reader1.get_token(), yaml.StreamStartToken)
+        self.assertTrue(reader1.check_token(yaml.BlockMappingStartToken))
+        self.assertEqual(len(reader2.tokens), 2)
+        self.assertIsInstance(reader2.peek_token(), yaml.StreamStartToken)
+        e1 = list(iter(reader1.get_token, None))
+        e2 = list(iter(reader2.get_token, None))
+        self.assertEqual(e2[1:], e1)
+        self.assertIsInstance(e1[-1], yaml.StreamEndToken)
+
+        tokens = token_stream('a: "b\n')
+        reader1, reader2 = tokens.reader(), tokens.reader()
+        self.assertRaises(yaml.scanner.ScannerError, list,
+                          iter(reader1.get_token, None))
+        self.assertEqual(len(reader2.tokens), 5)
+        self.assertRaises(yaml.scanner.ScannerError, list,
+                          iter(reader2.get_token, None))
+
+    def test_nesting(self):
+        nesting = Nesting()
+        e = []
+        for token in yaml.scan('a:\n  - {b: [c]}\n', yaml.BaseLoader):
+            nesting.update(token)
+            e.append((type(token).__name__,
+                      [(c.type, c.flow, c.key) for c in nesting.stack],
+                      nesting.flow_level))
+        M, S = Nesting.MAP, Nesting.SEQ
+        self.assertEqual(e, [
+            ('StreamStartToken', [], 0),
+            ('BlockMappingStartToken', [(M, False, False)], 0),
+            ('KeyToken', [(M, False, True)], 0),
+            ('ScalarToken', [(M, False, True)], 0),
+            ('ValueToken', [(M, False, False)], 0),
+            ('BlockSequenceStartToken', [(M, False, False), (S, False, False)],
+             0),
+            ('BlockEntryToken', [(M, False, False), (S, False, False)], 0),
+            ('FlowMappingStartToken', [(M, False, False), (S, False, False),
+                                       (M, True, False)], 1),
+            ('KeyToken', [(M, False, False), (S, False, False),
+                          (M, True, True)], 1),
+            ('ScalarToken', [(M, False, False), (S, False, False),
+                             (M, True, True)], 1),
+            ('ValueToken', [(M, False, False), (S, False, False),
+                            (M, True, False)], 1),
+            ('FlowSequenceStartToken', [(M, False, False), (S, False, False),
+                                        (M, True, False), (S, True, False)],
+             2),
+            ('ScalarToken', [(M, False, False), (S, False, False),
+                             (M, True, False), (S, True, False)], 2),
+            ('FlowSequenceEndToken', [(M, False, False), (S, False, False),
+                                      (M, True, False)], 1),
+            ('FlowMappingEndToken', [(M, False, False), (S, False, False)],
+             0),
+            ('BlockEndToken', [(M, False, False)], 0),
+            ('BlockEndToken', [], 0),
+            ('StreamEndToken', [], 0)])
+        self.assertIsNone(nesting.parent)
+
+        # Closing indicators can be found outside of collections
+        for token in yaml.scan(']\n', yaml.BaseLoader):
+            nesting.update(token)
+        self.assertEqual(nesting.depth, 0)
+        self.assertEqual(nesting.flow_level, -1)
@@ -32,6 +32,24 @@ class YamlLintTestCase(RuleTestCase):
                    '%TAG ! tag:clarkevans.com,2002:\n'
                    'doc: ument\n'
                    '...\n', None, problem=(3, 1))
+        self.check('---\n'
+                   'key: >#\n'
+                   '  text\n', None, problem=(2, 7))
+        self.check('---\n'
+                   '- |-2#\n'
+                   '  text\n', None, problem=(2, 6))
+        self.check('---\n'
+                   '[a\n'
+                   '  ? b]\n', None, problem=(3, 3))
+        self.check('[a\n'
+                   '? b]\n', None, problem1=(1, 1, 'document-start'),
+                   problem2=(2, 1))
+        self.check('---\n'
+                   '- [~\n'
+                   '  ? b]\n', None, problem=(3, 3))
+        self.check('---\n'
+                   '[a\r\n'
+                   '? b]\n', None, problem=(3, 1))
 
     def test_empty_flows(self):
         self.check('---\n'
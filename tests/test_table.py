@@ -0,0 +1,108 @@
+# Copyright (C) 2026 agent
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import io
+import json
+import unittest
+
+from yamllint import linter
+from yamllint.config import YamlLintConfig
+from yamllint.table import ProblemTable
+
+
+class ProblemTableTestCase(unittest.TestCase):
+    conf = YamlLintConfig('extends: default')
+
+    def test_columns(self):
+        table = ProblemTable()
+        table.extend(linter.run('key: value  \nother: yes\n', self.conf),
+                     'a.yaml')
+        table.extend(linter.run('---\n[a, b\n', self.conf), 'b.yaml')
+        table.extend([])
+
+        self.assertEqual(len(table), 4)
+        self.assertEqual(list(table.lines), [1, 1, 2, 3])
+        self.assertEqual(list(table.columns), [1, 11, 8, 1])
+        self.assertEqual(list(table.levels), [1, 2, 1, 2])
+        self.assertEqual(table.rule_ids,
+                         ['document-start', 'trailing-spaces', 'truthy',
+                          None])
+        self.assertEqual(list(table.rules), [0, 1, 2, 3])
+        self.assertEqual(table.filepaths, ['a.yaml', 'b.yaml'])
+        self.assertEqual(list(table.files), [0, 0, 0, 1])
+
+        self.assertEqual(table.desc(1), 'trailing spaces')
+        problem = table.problem(2)
+        self.assertEqual((problem.line, problem.column, problem.rule,
+                          problem.level),
+                         (2, 8, 'truthy', 'warning'))
+        self.assertEqual(table.to_dict()['level'],
+                         ['warning', 'error', 'warning', 'error'])
+
+    def test_lazy_desc(self):
+        calls = []
+
+        def desc():
+            calls.append(1)
+            return 'built'
+
+        table = ProblemTable()
+        problem = linter.LintProblem(1, 2, desc, 'rule')
+        problem.level = 'error'
+        table.extend([problem])
+        self.assertEqual(calls, [])
+        self.assertEqual(table.desc(0), 'built')
+        self.assertEqual(table.desc(0), 'built')
+        self.assertEqual(calls, [1])
+
+    def test_failed_extend(self):
+        def problems(level):
+            for line in (1, 2):
+                problem = linter.LintProblem(line, 1, 'desc', 'rule')
+                problem.level = level if line == 2 else 'error'
+                yield problem
+            raise ValueError('unreadable file')
+
+        table = ProblemTable()
+        table.extend(linter.run('key: value  \n', self.conf), 'a.yaml')
+        self.assertRaises(KeyError, table.extend, problems('unknown'),
+                          'b.yaml')
+        self.assertRaises(ValueError, table.extend, problems('error'),
+                          'b.yaml')
+
+        # Problems of a file that failed are all left out
+        self.assertEqual(len(table), 2)
+        for column in (table.lines, table.columns, table.levels, table.rules,
+                       table.files):
+            self.assertEqual(len(column), 2)
+        self.assertEqual(table.to_dict()['desc'],
+                         ['missing document start "---"', 'trailing spaces'])
+
+    def test_json_lines(self):
+        table = ProblemTable()
+        table.extend(linter.run('key: "value"  \n', self.conf), 'dir/"a".yaml')
+        output = io.StringIO()
+        table.write_json_lines(output)
+        rows = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(rows, [
+            {'file': 'dir/"a".yaml', 'line': 1, 'column': 1,
+             'level': 'warning', 'rule': 'document-start',
+             'desc': 'missing document start "---"'},
+            {'file': 'dir/"a".yaml', 'line': 1, 'column': 13,
+             'level': 'error', 'rule': 'trailing-spaces',
+             'desc': 'trailing spaces'}])
+        self.assertEqual(rows, [
+            {k: v[i] for k, v in table.to_dict().items()}
+            for i in range(len(table))])
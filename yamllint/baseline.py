@@ -0,0 +1,181 @@
+# Copyright (C) 2026 agent
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Baselines of known problems, to only report new ones.
+
+A baseline file lists, for each linted file, one fingerprint per problem:
+
+::
+
+ # yamllint baseline v1
+ path: "path/to/file.yaml"
+   trailing-spaces 3f2a1b4c5d6e7f80
+   line-length 9b8a7c6d5e4f3a21
+
+A fingerprint only depends on the rule and on the content of the line the
+problem is on (without surrounding spaces), so that adding or removing lines
+elsewhere in the file doesn't invalidate it. Paths are JSON strings, so that
+any character (e.g. leading spaces, or line breaks) can be recorded.
+"""
+
+import collections
+import hashlib
+import json
+import os
+import tempfile
+
+HEADER = '# yamllint baseline v1'
+PATH_PREFIX = 'path: '
+
+
+class BaselineError(Exception):
+    pass
+
+
+def fingerprint(problem, lines):
+    """Computes the fingerprint of a problem found in a file.
+
+    :param problem: the LintProblem to fingerprint
+    :param lines: the lines of the linted file
+    """
+    if 0 < problem.line <= len(lines):
+        content = lines[problem.line - 1].strip()
+    else:
+        content = ''
+    digest = hashlib.blake2b(content.encode('utf-8', 'surrogatepass'),
+                             digest_size=8).hexdigest()
+    return f'{problem.rule or "syntax"} {digest}'
+
+
+class Baseline:
+    """Known problems, read from a baseline file.
+
+    Only the position of each file section is kept in memory: the fingerprints
+    of a file are only loaded when this file is filtered.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.sections = {}
+
+        with open(path, 'rb') as f:
+            if f.readline().rstrip(b'\r\n') != HEADER.encode():
+                raise BaselineError(
+                    f'invalid baseline: {path}: missing "{HEADER}" header')
+            current, start = None, f.tell()
+            for line in iter(f.readline, b''):
+                if not line.startswith(b' ') and line.strip():
+                    end = f.tell() - len(line)
+                    if current is not None:
+                        self.sections[current] = (start, end)
+                    current = self.parse_path(line)
+                    start = f.tell()
+            if current is not None:
+                self.sections[current] = (start, f.tell())
+
+    def parse_path(self, line):
+        try:
+            line = line.rstrip(b'\r\n').decode('utf-8')
+            if line.startswith(PATH_PREFIX):
+                path = json.loads(line[len(PATH_PREFIX):])
+                if isinstance(path, str):
+                    return path
+        except ValueError:
+            pass
+        raise BaselineError(
+            f'invalid baseline: {self.path}: invalid line "{line}"')
+
+    def known_problems(self, filepath):
+        """Returns a counter of the fingerprints recorded for a file."""
+        if filepath not in self.sections:
+            return collections.Counter()
+
+        start, end = self.sections[filepath]
+        with open(self.path, 'rb') as f:
+            f.seek(start)
+            content = f.read(end - start).decode('utf-8')
+        return collections.Counter(line.strip()
+                                   for line in content.splitlines()
+                                   if line.strip())
+
+    def filter(self, problems, filepath, buffer):
+        """Yields the problems of a file that are not in the baseline.
+
+        :param problems: problems found in the file
+        :param filepath: path of the file, as recorded in the baseline
+        :param buffer: decoded content of the file
+        """
+        known = self.known_problems(filepath)
+        if not known:
+            yield from problems
+            return
+
+        lines = buffer.split('\n')
+        for problem in problems:
+            key = fingerprint(problem, lines)
+            if known[key] > 0:
+                known[key] -= 1
+            else:
+                yield problem
+
+
+class BaselineWriter:
+    """Writes a baseline file, one file section at a time.
+
+    Sections are written to a temporary file, that only replaces the baseline
+    file when it is closed: until then, the previous baseline is left as it
+    was.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.file = tempfile.NamedTemporaryFile(
+            'w', encoding='utf-8', dir=os.path.dirname(path) or '.',
+            prefix=f'.{os.path.basename(path)}.', suffix='.tmp', delete=False)
+        self.file.write(HEADER + '\n')
+
+    def add(self, problems, filepath, buffer):
+        """Records the problems of a file."""
+        lines = None
+        for problem in problems:
+            if lines is None:
+                lines = buffer.split('\n')
+                self.file.write(f'{PATH_PREFIX}{json.dumps(filepath)}\n')
+            self.file.write(f'  {fingerprint(problem, lines)}\n')
+
+    def close(self):
+        """Replaces the baseline file with the problems recorded."""
+        if self.file.closed:
+            return
+        self.file.close()
+        # Temporary files are only readable by their owner: keep the mode of
+        # the previous baseline, or use the default one for new files
+        try:
+            mode = os.stat(self.path).st_mode & 0o7777
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        try:
+            os.chmod(self.file.name, mode)
+            os.replace(self.file.name, self.path)
+        except OSError:
+            os.unlink(self.file.name)
+            raise
+
+    def discard(self):
+        """Leaves the baseline file as it was."""
+        if self.file.closed:
+            return
+        self.file.close()
+        os.unlink(self.file.name)
@@ -14,12 +14,21 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import argparse
+import heapq
 import locale
 import os
 import platform
 import sys
 
-from yamllint import APP_DESCRIPTION, APP_NAME, APP_VERSION, linter
+from yamllint import (
+    APP_DESCRIPTION,
+    APP_NAME,
+    APP_VERSION,
+    decoder,
+    hooks,
+    linter,
+)
+from yamllint.baseline import Baseline, BaselineError, BaselineWriter
 from yamllint.config import YamlLintConfig, YamlLintConfigError
 from yamllint.linter import PROBLEM_LEVELS
 
@@ -152,6 +161,9 @@ def run(argv=None):
                              help='files to check')
     files_group.add_argument('-', action='store_true', dest='stdin',
                              help='read from standard input')
+    files_group.add_argument('--lsp', action='store_true',
+                             help='run a language server on standard input '
+                                  'and output')
     config_group = parser.add_mutually_exclusive_group()
     config_group.add_argument('-c', '--config-file', dest='config_file',
                               action='store',
@@ -172,11 +184,31 @@ def run(argv=None):
     parser.add_argument('--no-warnings',
                         action='store_true',
                         help='output only error level problems')
+    parser.add_argument('--syntax-only', action='store_true',
+                        dest='syntax_only',
+                        help='only report syntax errors, without checking '
+                             'rules')
+    parser.add_argument('-j', '--jobs', type=int, default=1, metavar='N',
+                        help='lint large files in N processes (0 for one '
+                             'per CPU)')
+    parser.add_argument('--baseline', dest='baseline', action='store',
+                        metavar='FILE',
+                        help='do not report problems recorded in this '
+                             'baseline file')
+    parser.add_argument('--generate-baseline', action='store_true',
+                        dest='generate_baseline',
+                        help='record all current problems in the baseline '
+                             'file instead of reporting them')
     parser.add_argument('-v', '--version', action='version',
                         version=f'{APP_NAME} {APP_VERSION}')
 
     args = parser.parse_args(argv)
 
+    if args.generate_baseline and args.baseline is None:
+        parser.error('--generate-baseline requires --baseline')
+    if args.jobs < 0:
+        parser.error('--jobs must not be negative')
+
     if 'YAMLLINT_CONFIG_FILE' in os.environ:
         user_global_config = os.path.expanduser(
             os.environ['YAMLLINT_CONFIG_FILE'])
@@ -208,24 +240,104 @@ def run(argv=None):
     if conf.locale is not None:
         locale.setlocale(locale.LC_ALL, conf.locale)
 
+    if args.lsp:
+        # Not imported otherwise, to start faster
+        from yamllint import lsp
+        sys.exit(lsp.serve(conf))
+
     if args.list_files:
         for file in find_files_recursively(args.files, conf):
             if not conf.is_file_ignored(file):
                 print(file)
         sys.exit(0)
 
+    baseline = baseline_writer = None
+    try:
+        if args.generate_baseline:
+            baseline_writer = BaselineWriter(args.baseline)
+        elif args.baseline is not None:
+            baseline = Baseline(args.baseline)
+    except (OSError, BaselineError) as e:
+        print(e, file=sys.stderr)
+        sys.exit(-1)
+
+    def fail(error):
+        print(error, file=sys.stderr)
+        if baseline_writer is not None:
+            # The previous baseline is left as it was
+            baseline_writer.discard()
+        sys.exit(-1)
+
+    hooks.load_entry_points()
+    hooks.call('run_start')
+
+    files = list(find_files_recursively(args.files, conf))
+    try:
+        # Problems found across files by project rules, if any
+        project_problems = {} if args.syntax_only else linter.run_project(
+            [file.removeprefix('./') for file in files], conf,
+            args.jobs or None)
+    except OSError as e:
+        fail(e)
+
+    # Warnings that are neither shown, counted nor recorded in a baseline don't
+    # need to be looked for
+    no_warnings = (args.no_warnings and not args.strict and
+                   baseline_writer is None)
+
+    def lint(input, filepath, name):
+        if (baseline is None and baseline_writer is None and args.jobs == 1
+                and not args.syntax_only):
+            # Problems must be read before the input is closed
+            problems = linter.run_stream(input, conf, filepath,
+                                         no_warnings=no_warnings)
+        else:
+            # Baselines need the decoded content to fingerprint problems
+            with hooks.phase('decode', name):
+                buffer = decoder.auto_decode(input.read())
+            if args.syntax_only:
+                problems = linter.run_syntax(buffer, conf, filepath)
+            elif args.jobs != 1:
+                problems = linter.run_parallel(buffer, conf, filepath,
+                                               args.jobs or None, no_warnings)
+            else:
+                problems = linter.run(buffer, conf, filepath, no_warnings)
+        if project_problems.get(filepath):
+            problems = heapq.merge(
+                problems, project_problems[filepath],
+                key=lambda problem: (problem.line, problem.column))
+        if baseline_writer is not None:
+            baseline_writer.add(problems, name, buffer)
+            return []
+        if baseline is not None:
+            return baseline.filter(problems, name, buffer)
+        return problems
+
     max_level = 0
 
-    for file in find_files_recursively(args.files, conf):
+    def lint_and_show(input, filepath, name, file):
+        hooks.call('file_start', filepath=name)
+        with hooks.phase('lint', name):
+            problems = lint(input, filepath, name)
+            if hooks.registered():
+                # Otherwise problems are found while they are shown
+                problems = list(problems)
+        prob_level = 0
+        if baseline_writer is None:
+            with hooks.phase('output', name):
+                prob_level = show_problems(problems, file,
+                                           args_format=args.format,
+                                           no_warn=args.no_warnings)
+        hooks.call('file_end', filepath=name)
+        return prob_level
+
+    for file in files:
         filepath = file.removeprefix('./')
         try:
             with open(file, mode='rb') as f:
-                problems = linter.run(f, conf, filepath)
+                prob_level = lint_and_show(f, filepath, filepath, file)
         except OSError as e:
-            print(e, file=sys.stderr)
-            sys.exit(-1)
-        prob_level = show_problems(problems, file, args_format=args.format,
-                                   no_warn=args.no_warnings)
+            fail(e)
         max_level = max(max_level, prob_level)
 
     # read yaml from stdin
@@ -234,13 +346,17 @@ def run(argv=None):
             # The .buffer part makes sure that we get the raw bytes. We need to
             # get the raw bytes so that we can autodetect the character
             # encoding.
-            problems = linter.run(sys.stdin.buffer, conf, '')
+            prob_level = lint_and_show(sys.stdin.buffer, '', 'stdin', 'stdin')
+            max_level = max(max_level, prob_level)
         except OSError as e:
-            print(e, file=sys.stderr)
-            sys.exit(-1)
-        prob_level = show_problems(problems, 'stdin', args_format=args.format,
-                                   no_warn=args.no_warnings)
-        max_level = max(max_level, prob_level)
+            fail(e)
+
+    hooks.report_rule_stats()
+    hooks.call('run_end')
+
+    if baseline_writer is not None:
+        baseline_writer.close()
+        sys.exit(0)
 
     if max_level == PROBLEM_LEVELS['error']:
         return_code = 1
@@ -50,11 +50,15 @@ class YamlLintConfig:
     def is_yaml_file(self, filepath):
         return self.yaml_files.match_file(os.path.basename(filepath))
 
+    def enabled_rule_ids(self, filepath):
+        return tuple(id for id, val in self.rules.items()
+                     if val is not False and (
+                         filepath is None or 'ignore' not in val or
+                         not val['ignore'].match_file(filepath)))
+
     def enabled_rules(self, filepath):
-        return [yamllint.rules.get(id) for id, val in self.rules.items()
-                if val is not False and (
-                    filepath is None or 'ignore' not in val or
-                    not val['ignore'].match_file(filepath))]
+        return [yamllint.rules.get(id)
+                for id in self.enabled_rule_ids(filepath)]
 
     def extend(self, base_config):
         assert isinstance(base_config, YamlLintConfig)
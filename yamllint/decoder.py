@@ -71,6 +71,26 @@ def auto_decode(stream_data):
     return stream_data.decode(encoding=detect_encoding(stream_data))
 
 
+def stream_reader(stream):
+    """Returns a function that reads about ``size`` bytes (or characters) from
+    a stream, and returns them as text along with whether the end of the
+    stream was reached. The encoding of binary streams is detected like
+    auto_decode() does, on the first bytes read."""
+    decoder = None
+
+    def read(size):
+        nonlocal decoder
+        # Up to 4 bytes are needed to detect the encoding
+        data = stream.read(size if decoder is not None else max(size, 4))
+        if isinstance(data, str):
+            return data, not data
+        if decoder is None:
+            decoder = codecs.getincrementaldecoder(detect_encoding(data))()
+        return decoder.decode(data, final=not data), not data
+
+    return read
+
+
 def lines_in_files(paths):
     """Autodecodes files and yields their lines."""
     for path in paths:
@@ -0,0 +1,138 @@
+# Copyright (C) 2026 agent
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Instrumentation hooks, to time and count what yamllint does.
+
+Hooks are objects with the methods of ``Hook``, registered with
+``register()`` or by installed packages, with an entry point in the
+``yamllint.hooks`` group (loaded by the command line).
+
+When no hook is registered, rules are called directly: nothing is timed or
+counted while tokens are linted.
+"""
+
+import contextlib
+import functools
+import time
+
+ENTRY_POINT_GROUP = 'yamllint.hooks'
+
+_hooks = []
+
+# Calls of rules and time spent in them, by rule ID
+_rule_stats = {}
+
+
+class Hook:
+    """Base class for hooks, that do nothing by default.
+
+    Phases of a file are ``'decode'`` (only when the whole file is decoded
+    before being linted), ``'lint'`` (tokens are scanned and checked by rules
+    at the same time) and ``'output'``.
+    """
+    def run_start(self):
+        pass
+
+    def run_end(self):
+        pass
+
+    def file_start(self, filepath):
+        pass
+
+    def file_end(self, filepath):
+        pass
+
+    def phase_start(self, phase, filepath):
+        pass
+
+    def phase_end(self, phase, filepath):
+        pass
+
+    def rule_stats(self, stats):
+        """Called at the end of a run, with ``(calls, seconds)`` tuples by
+        rule ID."""
+        pass
+
+
+def register(hook):
+    _hooks.append(hook)
+
+
+def unregister(hook):
+    _hooks.remove(hook)
+
+
+def registered():
+    return bool(_hooks)
+
+
+def load_entry_points():
+    """Registers the hooks of installed packages."""
+    import importlib.metadata
+    try:
+        entry_points = importlib.metadata.entry_points(
+            group=ENTRY_POINT_GROUP)
+    except TypeError:  # Python < 3.10
+        entry_points = importlib.metadata.entry_points().get(
+            ENTRY_POINT_GROUP, ())
+    for entry_point in entry_points:
+        register(entry_point.load()())
+
+
+def call(method, **kwargs):
+    for hook in _hooks:
+        getattr(hook, method)(**kwargs)
+
+
+@contextlib.contextmanager
+def phase(name, filepath):
+    call('phase_start', phase=name, filepath=filepath)
+    try:
+        yield
+    finally:
+        call('phase_end', phase=name, filepath=filepath)
+
+
+def report_rule_stats():
+    """Gives the rule statistics gathered so far to hooks, and resets them."""
+    stats = {id: tuple(stat) for id, stat in _rule_stats.items()}
+    _rule_stats.clear()
+    call('rule_stats', stats=stats)
+
+
+class TimedRule:
+    """Rule that counts its calls and the time spent in them.
+
+    Linter plans use them instead of rules when hooks are registered.
+    """
+    def __init__(self, rule):
+        self.rule = rule
+        if hasattr(rule, 'check_lines'):
+            self.check_lines = functools.partial(self._timed,
+                                                 rule.check_lines)
+
+    def __getattr__(self, name):
+        return getattr(self.rule, name)
+
+    def check(self, *args):
+        return self._timed(self.rule.check, *args)
+
+    def _timed(self, check, *args):
+        start = time.perf_counter()
+        problems = list(check(*args))
+        stat = _rule_stats.setdefault(self.rule.ID, [0, 0.0])
+        stat[0] += 1
+        stat[1] += time.perf_counter() - start
+        return problems
@@ -13,12 +13,19 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import bisect
+import concurrent.futures
+import copy
 import io
+import itertools
+import os
 import re
+import weakref
+import zlib
 
 import yaml
 
-from yamllint import decoder, parser
+from yamllint import decoder, hooks, parser
 
 PROBLEM_LEVELS = {
     0: None,
@@ -31,21 +38,50 @@ PROBLEM_LEVELS = {
 
 DISABLE_RULE_PATTERN = re.compile(r'^# yamllint disable( rule:\S+)*\s*$')
 ENABLE_RULE_PATTERN = re.compile(r'^# yamllint enable( rule:\S+)*\s*$')
+DISABLE_LINE_RULE_PATTERN = re.compile(
+    r'^# yamllint disable-line( rule:\S+)*\s*$')
+
+# How many scanned tokens the syntax checker lets wait before parsing them
+TOKENS_KEPT_BY_SYNTAX_CHECKER = 64
+STREAM_CHUNK_SIZE = 64 * 1024
+# Minimum size of the parts of a buffer linted in parallel
+PARALLEL_PART_SIZE = 256 * 1024
+# Maximum size of the groups of small documents that DocumentCache lints
+# together
+CACHE_GROUP_SIZE = 2 * 1024
+DOCUMENT_START_PATTERN = re.compile(
+    r'^---(?=[\0 \t\r\n\x85\u2028\u2029]|\Z)', re.MULTILINE)
 
 
 class LintProblem:
-    """Represents a linting problem found by yamllint."""
+    """Represents a linting problem found by yamllint.
+
+    ``desc`` can also be a function that returns the description, so that it
+    is only built if needed (not for problems disabled by directives).
+    """
+    __slots__ = ('line', 'column', '_desc', 'rule', 'level')
+
     def __init__(self, line, column, desc='<no description>', rule=None):
         #: Line on which the problem was found (starting at 1)
         self.line = line
         #: Column on which the problem was found (starting at 1)
         self.column = column
-        #: Human-readable description of the problem
-        self.desc = desc
+        self._desc = desc
         #: Identifier of the rule that detected the problem
         self.rule = rule
         self.level = None
 
+    @property
+    def desc(self):
+        """Human-readable description of the problem"""
+        if callable(self._desc):
+            self._desc = self._desc()
+        return self._desc
+
+    @desc.setter
+    def desc(self, desc):
+        self._desc = desc
+
     @property
     def message(self):
         if self.rule is not None:
@@ -65,74 +101,222 @@ class LintProblem:
         return f'{self.line}:{self.column}: {self.message}'
 
 
-def get_cosmetic_problems(buffer, conf, filepath):
-    rules = conf.enabled_rules(filepath)
+class DisableDirective:
+    def __init__(self, all_rules):
+        self.rules = set()
+        self.all_rules = all_rules
 
-    # Split token rules from line rules
-    token_rules = [r for r in rules if r.TYPE == 'token']
-    comment_rules = [r for r in rules if r.TYPE == 'comment']
-    line_rules = [r for r in rules if r.TYPE == 'line']
+    def process_comment(self, comment):
+        if DISABLE_RULE_PATTERN.match(comment):
+            items = comment[18:].rstrip().split(' ')
+            rules = [item[5:] for item in items][1:]
+            if len(rules) == 0:
+                self.rules = self.all_rules.copy()
+            else:
+                for id in rules:
+                    if id in self.all_rules:
+                        self.rules.add(id)
 
-    context = {}
-    for rule in token_rules:
-        context[rule.ID] = {}
+        elif ENABLE_RULE_PATTERN.match(comment):
+            items = comment[17:].rstrip().split(' ')
+            rules = [item[5:] for item in items][1:]
+            if len(rules) == 0:
+                self.rules.clear()
+            else:
+                for id in rules:
+                    self.rules.discard(id)
 
-    class DisableDirective:
-        def __init__(self):
-            self.rules = set()
-            self.all_rules = {r.ID for r in rules}
 
-        def process_comment(self, comment):
-            comment = str(comment)
+class DisableLineDirective(DisableDirective):
+    def process_comment(self, comment):
+        if DISABLE_LINE_RULE_PATTERN.match(comment):
+            items = comment[23:].rstrip().split(' ')
+            rules = [item[5:] for item in items][1:]
+            if len(rules) == 0:
+                self.rules = self.all_rules.copy()
+            else:
+                for id in rules:
+                    if id in self.all_rules:
+                        self.rules.add(id)
 
-            if DISABLE_RULE_PATTERN.match(comment):
-                items = comment[18:].rstrip().split(' ')
-                rules = [item[5:] for item in items][1:]
-                if len(rules) == 0:
-                    self.rules = self.all_rules.copy()
-                else:
-                    for id in rules:
-                        if id in self.all_rules:
-                            self.rules.add(id)
-
-            elif ENABLE_RULE_PATTERN.match(comment):
-                items = comment[17:].rstrip().split(' ')
-                rules = [item[5:] for item in items][1:]
-                if len(rules) == 0:
-                    self.rules.clear()
-                else:
-                    for id in rules:
-                        self.rules.discard(id)
 
-        def is_disabled_by_directive(self, problem):
-            return problem.rule in self.rules
+def directive_pointers(buffer, start=0, end=None):
+    """Finds where comments can be yamllint directives, i.e. where
+    ``# yamllint`` is found in the buffer (in most files, nowhere)."""
+    pointers = set()
+    pointer = buffer.find('# yamllint', start, end)
+    while pointer != -1:
+        pointers.add(pointer)
+        pointer = buffer.find('# yamllint', pointer + 10, end)
+    return pointers
 
-    class DisableLineDirective(DisableDirective):
-        def process_comment(self, comment):
-            comment = str(comment)
 
-            if re.match(r'^# yamllint disable-line( rule:\S+)*\s*$', comment):
-                items = comment[23:].rstrip().split(' ')
-                rules = [item[5:] for item in items][1:]
-                if len(rules) == 0:
-                    self.rules = self.all_rules.copy()
-                else:
-                    for id in rules:
-                        if id in self.all_rules:
-                            self.rules.add(id)
+class LintPlan:
+    """Rules to run on a file, with their configuration.
+
+    A plan is prepared once for all files that enable the same rules (see
+    ``lint_plan()``).
+    """
+    def __init__(self, conf, rules):
+        #: IDs of the rules, that directives can disable
+        self.rule_ids = {rule.ID for rule in rules}
+        self.token_rules = [(rule, conf.rules[rule.ID]) for rule in rules
+                            if rule.TYPE == 'token']
+        self.comment_rules = [(rule, conf.rules[rule.ID]) for rule in rules
+                              if rule.TYPE == 'comment']
+        self.line_rules = [(rule, conf.rules[rule.ID]) for rule in rules
+                           if rule.TYPE == 'line']
+        self.event_rules = [(rule, conf.rules[rule.ID]) for rule in rules
+                            if rule.TYPE == 'event']
+        self.project_rules = [(rule, conf.rules[rule.ID]) for rule in rules
+                              if rule.TYPE == 'project']
+        #: Token rules that need to know the nesting of tokens
+        self.nesting_rules = [(rule, rule_conf)
+                              for rule, rule_conf in self.token_rules
+                              if getattr(rule, 'NESTING', False)]
+        self._token_rules_by_type = {}
+        self._event_rules_by_type = {}
+
+    def token_rules_for(self, token_type):
+        """Returns the token rules to call for a type of token: rules that
+        declare TOKENS are only called for these types of tokens."""
+        if token_type not in self._token_rules_by_type:
+            self._token_rules_by_type[token_type] = [
+                (rule, rule_conf) for rule, rule_conf in self.token_rules
+                if issubclass(token_type, getattr(rule, 'TOKENS', yaml.Token))]
+        return self._token_rules_by_type[token_type]
+
+    def event_rules_for(self, event_type):
+        """Returns the event rules to call for a type of event: rules that
+        declare EVENTS are only called for these types of events."""
+        if event_type not in self._event_rules_by_type:
+            self._event_rules_by_type[event_type] = [
+                (rule, rule_conf) for rule, rule_conf in self.event_rules
+                if issubclass(event_type, getattr(rule, 'EVENTS', yaml.Event))]
+        return self._event_rules_by_type[event_type]
+
+
+_lint_plans = weakref.WeakKeyDictionary()
+
+
+def lint_plan(conf, filepath, features=None, no_warnings=False):
+    """Returns the LintPlan for a file (the same for files with the same
+    enabled rules).
+
+    :param features: features of the linted buffer (see
+                     ``parser.buffer_features()``), to leave out the rules
+                     that can't report problems on it
+    :param no_warnings: whether to leave out rules of ``warning`` level
+    """
+    # Plans are prepared again when the configuration of rules changed, or
+    # the rules registered with their IDs
+    rules_conf, plans = _lint_plans.get(conf, (None, None))
+    if rules_conf != conf.rules:
+        rules_conf, plans = copy.deepcopy(conf.rules), {}
+        _lint_plans[conf] = rules_conf, plans
+    enabled_rules = conf.enabled_rules(filepath)
+    key = (tuple(rule.ID for rule in enabled_rules), hooks.registered(),
+           features, no_warnings)
+    if key not in plans or plans[key][0] != enabled_rules:
+        rules = [rule for rule in enabled_rules
+                 if (features is None or not hasattr(rule, 'applies') or
+                     rule.applies(conf.rules[rule.ID], features)) and
+                 not (no_warnings and
+                      conf.rules[rule.ID]['level'] == 'warning')]
+        # Buffers with different features often leave the same rules
+        rules_key = tuple(rule.ID for rule in rules), hooks.registered()
+        if rules_key not in plans or plans[rules_key][0] != rules:
+            plan_rules = rules
+            if hooks.registered():
+                # Only count and time rules when someone asks
+                plan_rules = [hooks.TimedRule(rule) for rule in rules]
+            plans[rules_key] = rules, LintPlan(conf, plan_rules)
+        plans[key] = enabled_rules, plans[rules_key][1]
+    return plans[key][1]
+
+
+def get_cosmetic_problems(buffer, conf, filepath, segment=None, state=None,
+                          tokens=None, syntax_checker=None, features=None,
+                          no_warnings=False):
+    plan = lint_plan(conf, filepath, features, no_warnings)
+
+    context = {}
+    for rule, _ in plan.token_rules + plan.event_rules:
+        context[rule.ID] = {}
+    nesting = parser.Nesting() if plan.nesting_rules else None
+    for rule, _ in plan.nesting_rules:
+        context[rule.ID]['nesting'] = nesting
 
     # Use a cache to store problems and flush it only when an end of line is
     # found. This allows the use of yamllint directive to disable some rules on
     # some lines.
     cache = []
-    disabled = DisableDirective()
-    disabled_for_line = DisableLineDirective()
-    disabled_for_next_line = DisableLineDirective()
+    disabled = DisableDirective(plan.rule_ids)
+    disabled_for_line = DisableLineDirective(plan.rule_ids)
+    disabled_for_next_line = DisableLineDirective(plan.rule_ids)
+    if segment is None:
+        directives = directive_pointers(buffer)
+    else:
+        directives = directive_pointers(buffer, segment.start, segment.end)
 
-    for elem in parser.token_or_comment_or_line_generator(buffer):
+    if state is not None:
+        # Resume where the previous segment ended
+        context = copy.deepcopy(state.context)
+        if nesting is not None:
+            nesting = context[plan.nesting_rules[0][0].ID]['nesting']
+        disabled.rules = set(state.disabled)
+        disabled_for_line.rules = set(state.disabled_for_line)
+        cache = list(state.cache)
+
+    # Event rules are called with the events parsed to check the syntax.
+    # Problems they find wait in `event_problems` until the line they are on
+    # is reached.
+    event_problems = []
+    if plan.event_rules:
+        if syntax_checker is None:
+            if tokens is None:
+                tokens = parser.token_stream(buffer, segment)
+            syntax_checker = SyntaxChecker(tokens)
+
+        def check_event(event):
+            # Segments are parsed as streams of their own
+            if segment is not None and (
+                    (isinstance(event, yaml.StreamStartEvent) and
+                     not segment.first) or
+                    (isinstance(event, yaml.StreamEndEvent) and
+                     not segment.last)):
+                return
+            for rule, rule_conf in plan.event_rules_for(type(event)):
+                for problem in rule.check(rule_conf, event, context[rule.ID]):
+                    problem.rule = rule.ID
+                    problem.level = rule_conf['level']
+                    event_problems.append(problem)
+
+        syntax_checker.on_event = check_event
+
+    # Line rules that check all lines at once: their problems wait (the last
+    # ones first) until the line they are on is reached
+    if segment is None:
+        start, end, line_no = 0, len(buffer), 1
+    else:
+        start, end, line_no = segment.start, segment.end, segment.line_no
+    line_rules = []
+    for rule, rule_conf in plan.line_rules:
+        queued = None
+        if hasattr(rule, 'check_lines'):
+            queued = list(rule.check_lines(rule_conf, buffer, start, end,
+                                           line_no))
+            queued.reverse()
+        line_rules.append((rule, rule_conf, queued))
+
+    for elem in parser.token_or_comment_or_line_generator(
+            buffer, segment, tokens,
+            parser.Token(None, None, None, None, None),
+            parser.Line(None, buffer, None, None)):
         if isinstance(elem, parser.Token):
-            for rule in token_rules:
-                rule_conf = conf.rules[rule.ID]
+            if nesting is not None:
+                nesting.update(elem.curr)
+            for rule, rule_conf in plan.token_rules_for(type(elem.curr)):
                 for problem in rule.check(rule_conf,
                                           elem.curr, elem.prev, elem.next,
                                           elem.nextnext,
@@ -141,50 +325,145 @@ def get_cosmetic_problems(buffer, conf, filepath):
                     problem.level = rule_conf['level']
                     cache.append(problem)
         elif isinstance(elem, parser.Comment):
-            for rule in comment_rules:
-                rule_conf = conf.rules[rule.ID]
+            for rule, rule_conf in plan.comment_rules:
                 for problem in rule.check(rule_conf, elem):
                     problem.rule = rule.ID
                     problem.level = rule_conf['level']
                     cache.append(problem)
 
-            disabled.process_comment(elem)
-            if elem.is_inline():
-                disabled_for_line.process_comment(elem)
-            else:
-                disabled_for_next_line.process_comment(elem)
+            if elem.pointer in directives:
+                comment = str(elem)
+                disabled.process_comment(comment)
+                if elem.is_inline():
+                    disabled_for_line.process_comment(comment)
+                else:
+                    disabled_for_next_line.process_comment(comment)
         elif isinstance(elem, parser.Line):
-            for rule in line_rules:
-                rule_conf = conf.rules[rule.ID]
-                for problem in rule.check(rule_conf, elem):
+            for rule, rule_conf, queued in line_rules:
+                if queued is None:
+                    problems = rule.check(rule_conf, elem)
+                elif queued and queued[-1].line <= elem.line_no:
+                    problems = []
+                    while queued and queued[-1].line <= elem.line_no:
+                        problems.append(queued.pop())
+                else:
+                    continue
+                for problem in problems:
                     problem.rule = rule.ID
                     problem.level = rule_conf['level']
                     cache.append(problem)
 
+            if plan.event_rules:
+                syntax_checker.advance(elem.line_no)
+            if event_problems:
+                cache.extend(p for p in event_problems
+                             if p.line <= elem.line_no)
+                event_problems = [p for p in event_problems
+                                  if p.line > elem.line_no]
+
             # This is the last token/comment/line of this line, let's flush the
             # problems found (but filter them according to the directives)
-            for problem in cache:
-                if not (disabled_for_line.is_disabled_by_directive(problem) or
-                        disabled.is_disabled_by_directive(problem)):
-                    yield problem
+            if disabled.rules or disabled_for_line.rules:
+                for problem in cache:
+                    if not (problem.rule in disabled_for_line.rules or
+                            problem.rule in disabled.rules):
+                        yield problem
+            else:
+                yield from cache
 
-            disabled_for_line = disabled_for_next_line
-            disabled_for_next_line = DisableLineDirective()
+            if disabled_for_line.rules or disabled_for_next_line.rules:
+                disabled_for_line.rules = disabled_for_next_line.rules
+                disabled_for_next_line.rules = set()
             cache = []
 
+    if plan.event_rules:
+        # The last events are parsed after the last line
+        syntax_checker.advance()
+        if segment is None or segment.last:
+            for problem in event_problems:
+                if problem.rule not in disabled.rules:
+                    yield problem
+        else:
+            cache.extend(event_problems)
 
-def get_syntax_error(buffer):
-    try:
-        list(yaml.parse(buffer, Loader=yaml.BaseLoader))
-    except yaml.error.MarkedYAMLError as e:
-        problem = LintProblem(e.problem_mark.line + 1,
-                              e.problem_mark.column + 1,
-                              'syntax error: ' + e.problem + ' (syntax)')
-        problem.level = 'error'
-        return problem
+    if segment is not None and not segment.last:
+        # Save the state to lint the next segment from. Problems found on its
+        # first line (the `---` one) are still in cache, they are yielded
+        # with the next segment.
+        context = {
+            rule.ID: {k: v for k, v in context[rule.ID].items()
+                      if k not in getattr(rule, 'DOCUMENT_CONTEXT', ())}
+            for rule, _ in plan.token_rules + plan.event_rules}
+        segment.end_state = _State(
+            context, disabled.rules, disabled_for_line.rules, cache,
+            segment.tail, segment.marked_buffer, segment.end,
+            segment.line + parser.yaml_line_count(buffer, segment.start,
+                                                  segment.end),
+            segment.line_no + buffer.count('\n', segment.start, segment.end))
+
+
+class SyntaxChecker(yaml.parser.Parser):
+    """Parser that checks the syntax of tokens read from a TokenStream.
+
+    Parsing is done lazily, only as far as needed to know whether there is a
+    syntax error before a given line.
+    """
+    def __init__(self, tokens):
+        super().__init__()
+        self.stream = tokens
+        self.reader = tokens.reader()
+        self.reader.on_backlog = self._catch_up
+        self.check_token = self.reader.check_token
+        self.peek_token = self.reader.peek_token
+        self.get_token = self.reader.get_token
+        self.done = False
+        self.error = None
+        #: Function called with each event parsed, if any
+        self.on_event = None
+
+    def _catch_up(self):
+        self.advance(keep=TOKENS_KEPT_BY_SYNTAX_CHECKER)
+
+    def advance(self, line=None, keep=0):
+        """Parses events until the next token to parse is after ``line``.
 
+        :param line: line number (starting at 1), or ``None`` to parse all
+        :param keep: stop when no more than this many tokens wait to be parsed
+        """
+        while not self.done:
+            if keep and len(self.reader.tokens) <= keep:
+                return
+            if line is not None:
+                token = (self.reader.tokens[0] if self.reader.tokens
+                         else self.stream.last)
+                if token is not None and token.start_mark.line + 1 > line:
+                    return
+            try:
+                if self.check_event():
+                    event = self.get_event()
+                    if self.on_event is not None:
+                        self.on_event(event)
+                else:
+                    self.done = True
+            except yaml.error.MarkedYAMLError as e:
+                self.error = LintProblem(e.problem_mark.line + 1,
+                                         e.problem_mark.column + 1,
+                                         'syntax error: ' + e.problem +
+                                         ' (syntax)')
+                self.error.level = 'error'
+                self.done = True
+
+    def error_until(self, line=None):
+        """Returns the syntax error, if there is one until ``line``."""
+        self.advance(line)
+        return self.error
+
+
+def get_syntax_error(buffer, segment=None):
+    return SyntaxChecker(parser.token_stream(buffer, segment)).error_until()
 
-def _run(buffer, conf, filepath):
+
+def _run(buffer, conf, filepath, no_warnings=False):
     assert hasattr(buffer, '__getitem__'), \
         '_run() argument must be a buffer, not a stream'
     if isinstance(buffer, bytes):
@@ -194,12 +473,50 @@ def _run(buffer, conf, filepath):
     if re.match(r'^#\s*yamllint disable-file\s*$', first_line):
         return
 
-    # If the document contains a syntax error, save it and yield it at the
-    # right line
-    syntax_error = get_syntax_error(buffer)
+    # The same tokens are used for the rules and to check the syntax. If the
+    # document contains a syntax error, yield it at the right line.
+    tokens = parser.token_stream(buffer)
+    syntax_checker = SyntaxChecker(tokens)
+
+    yield from _insert_syntax_error(
+        get_cosmetic_problems(buffer, conf, filepath, tokens=tokens,
+                              syntax_checker=syntax_checker,
+                              features=parser.buffer_features(buffer),
+                              no_warnings=no_warnings),
+        syntax_checker.error_until, no_warnings)
+
+
+class _WarningsNeeded(Exception):
+    """Raised when a syntax error is found while warnings are left out."""
+
+
+def _errors_only(lint):
+    """Yields the problems of ``lint(False)`` that are errors.
+
+    ``lint(True)`` is tried first, without the rules of ``warning`` level. Up
+    to the syntax error, it finds the same errors. But the problem that a
+    syntax error replaces can be a warning: when a syntax error is found,
+    ``lint(True)`` raises _WarningsNeeded and ``lint(False)`` is resumed after
+    the errors already found.
+    """
+    count = 0
+    try:
+        for problem in lint(True):
+            yield problem
+            count += 1
+    except _WarningsNeeded:
+        yield from itertools.islice(
+            (problem for problem in lint(False) if problem.level == 'error'),
+            count, None)
+
 
-    for problem in get_cosmetic_problems(buffer, conf, filepath):
+def _insert_syntax_error(problems, find_syntax_error, no_warnings=False):
+    for problem in problems:
         # Insert the syntax error (if any) at the right place...
+        syntax_error = (find_syntax_error(problem.line)
+                        if find_syntax_error else None)
+        if syntax_error and no_warnings:
+            raise _WarningsNeeded
         if (syntax_error and syntax_error.line <= problem.line and
                 syntax_error.column <= problem.column):
             yield syntax_error
@@ -207,31 +524,913 @@ def _run(buffer, conf, filepath):
             # Discard the problem since it is at the same place as the syntax
             # error and is probably redundant (and maybe it's just a 'warning',
             # in which case the script won't even exit with a failure status).
-            syntax_error = None
+            find_syntax_error = None
             continue
 
         yield problem
 
-    if syntax_error:
-        yield syntax_error
+    if find_syntax_error and find_syntax_error():
+        if no_warnings:
+            raise _WarningsNeeded
+        yield find_syntax_error()
+
+
+def _freeze(value):
+    """Returns a hashable copy of a value, to compare linter states."""
+    if isinstance(value, dict):
+        return dict, tuple((k, _freeze(v)) for k, v in value.items())
+    elif isinstance(value, (list, tuple)):
+        return type(value), tuple(_freeze(v) for v in value)
+    elif isinstance(value, (set, frozenset)):
+        return type(value), frozenset(_freeze(v) for v in value)
+    elif isinstance(getattr(value, '__dict__', None), dict):
+        return type(value), _freeze(vars(value))
+    return value
+
+
+def _move_mark(mark, buffer, offset, lines):
+    return yaml.Mark(mark.name, mark.index + offset, mark.line + lines,
+                     mark.column, buffer, mark.pointer + offset)
+
+
+def _move_problem(problem, lines):
+    moved = LintProblem(problem.line + lines, problem.column, problem._desc,
+                        problem.rule)
+    moved.level = problem.level
+    return moved
+
+
+class _State:
+    """State of the linter at a document start, to resume linting from it.
+
+    ``pointer``, ``line`` and ``line_no`` locate the document start in the
+    buffer (PyYAML lines start at 0, yamllint lines at 1).
+    """
+    def __init__(self, context, disabled, disabled_for_line, cache, prev,
+                 buffer, pointer, line, line_no):
+        self.context = context
+        self.disabled = disabled
+        self.disabled_for_line = disabled_for_line
+        self.cache = cache
+        self.prev = prev
+        self.buffer = buffer
+        self.pointer = pointer
+        self.line = line
+        self.line_no = line_no
+        self._key = None
+
+    def key(self):
+        """Returns a hashable value, equal for states that lint the same.
+
+        Positions are relative to the document start.
+        """
+        if self._key is None:
+            prev = None
+            if self.prev is not None:
+                prev = (type(self.prev),
+                        _freeze({k: v for k, v in vars(self.prev).items()
+                                 if k not in ('start_mark', 'end_mark')}),
+                        tuple((m.pointer - self.pointer, m.line - self.line,
+                               m.column)
+                              for m in (self.prev.start_mark,
+                                        self.prev.end_mark)))
+            self._key = (
+                _freeze(self.context),
+                frozenset(self.disabled), frozenset(self.disabled_for_line),
+                tuple((p.line - self.line_no, p.column, p.desc, p.rule,
+                       p.level) for p in self.cache),
+                prev)
+        return self._key
+
+    def moved(self, buffer, pointer, line, line_no):
+        """Returns the same state, for a document start found elsewhere."""
+        if (buffer is self.buffer and pointer == self.pointer and
+                line == self.line and line_no == self.line_no):
+            return self
+        prev = self.prev
+        if prev is not None:
+            prev = copy.copy(prev)
+            prev.start_mark = _move_mark(prev.start_mark, buffer,
+                                         pointer - self.pointer,
+                                         line - self.line)
+            prev.end_mark = _move_mark(prev.end_mark, buffer,
+                                       pointer - self.pointer,
+                                       line - self.line)
+        state = _State(self.context, self.disabled, self.disabled_for_line,
+                       [_move_problem(p, line_no - self.line_no)
+                        for p in self.cache],
+                       prev, buffer, pointer, line, line_no)
+        state._key = self._key
+        return state
+
+
+class _Document:
+    """Result of linting a segment of a buffer (see DocumentCache).
+
+    ``failed`` tells that rules raised an exception on the segment.
+    """
+    def __init__(self, segment, problems, syntax_error, failed=False):
+        self.buffer = segment.marked_buffer
+        self.pointer = segment.start
+        self.line = segment.line
+        self.line_no = segment.line_no
+        self.problems = problems
+        self.syntax_error = syntax_error
+        self.end_state = segment.end_state
+
+        # A segment boundary is only valid if linting the segments separately
+        # gives the same tokens as linting them together. If not, both
+        # segments are linted again as one.
+        self.head_ok = segment.first or (
+            isinstance(segment.head, yaml.DocumentStartToken) and
+            segment.head.start_mark.pointer == segment.start)
+        # After a scanner error or in a flow collection, tokens after the
+        # segment end differ from those of the whole source, and so do lines
+        # once PyYAML counted more line breaks than yamllint (e.g. '\u2028'):
+        # the rest of the source must be linted along with the segment. So
+        # must it when rules failed, maybe on such tokens.
+        self.open_end = not segment.last and (
+            failed or not segment.complete or segment.flow_level != 0 or
+            segment.end_state.line + 1 != segment.end_state.line_no)
+        self.tail_ok = segment.last or (
+            not self.open_end and
+            not isinstance(segment.tail, yaml.DirectiveToken) and
+            (syntax_error is None or
+             syntax_error.line <= segment.end_state.line))
+
+    def moved(self, buffer, pointer, line, line_no, end_state=True):
+        """Returns the same result, for a segment found elsewhere.
+
+        If ``end_state`` is false, the end state is left where it was (it must
+        be moved before being used to lint the next segment).
+        """
+        if (buffer is self.buffer and pointer == self.pointer and
+                line == self.line and line_no == self.line_no):
+            return self
+        lines = line_no - self.line_no
+        document = copy.copy(self)
+        document.buffer = buffer
+        document.pointer = pointer
+        document.line = line
+        document.line_no = line_no
+        if lines != 0:
+            document.problems = [_move_problem(p, lines)
+                                 for p in self.problems]
+            if self.syntax_error is not None:
+                document.syntax_error = _move_problem(self.syntax_error,
+                                                      lines)
+        if end_state and self.end_state is not None:
+            state = self.end_state
+            document.end_state = state.moved(
+                buffer, state.pointer + pointer - self.pointer,
+                state.line + line - self.line, state.line_no + lines)
+        return document
+
+
+def _lint_segment(segment, conf, filepath, state, features=None,
+                  no_warnings=False):
+    """Lints a segment, and returns a _Document.
+
+    ``features`` must be the features of the whole source, for all its
+    segments.
+    """
+    tokens = parser.token_stream(segment.buffer, segment)
+    syntax_checker = SyntaxChecker(tokens)
+    try:
+        problems = list(get_cosmetic_problems(
+            segment.buffer, conf, filepath, segment, state, tokens,
+            syntax_checker, features, no_warnings))
+        syntax_error = syntax_checker.error_until()
+    except Exception:
+        # Tokens at the bounds of the segment can differ from those of the
+        # whole source, for instance when a closing indicator outside of any
+        # collection changes how the scanner reads the next document. Rules
+        # may fail on them: the segment is linted again with the rest of the
+        # source, or with the document before it.
+        document = _Document(segment, [], None, failed=True)
+        if segment.last and document.head_ok:
+            raise
+        return document
+    return _Document(segment, problems, syntax_error)
+
+
+def _count_lines(buffer, starts, lines, end):
+    """Appends the line numbers of ``starts[len(lines):end]`` to ``lines``."""
+    for i in range(len(lines), end):
+        line, line_no = lines[-1]
+        lines.append((
+            line + parser.yaml_line_count(buffer, starts[i - 1], starts[i]),
+            line_no + buffer.count('\n', starts[i - 1], starts[i])))
+
+
+class DocumentCache:
+    """Lints a YAML source one document at a time, to re-lint it faster.
+
+    Results are kept for each document (separated by ``---``), or group of
+    small documents, so that linting the source again after it changed only
+    lints the documents that changed, or that start in a different state (for
+    instance when the indentation detected in a previous document changed).
+    The problems found are the same as with ``run()``.
+
+    The source can be given whole to ``run()``, or changed with ``edit()``
+    then linted again with ``run()`` without arguments: document starts are
+    only searched around the edits, and documents before them are not even
+    looked up.
+
+    :param conf: yamllint configuration object
+    :param filepath: path of the linted file, if any
+    """
+    def __init__(self, conf, filepath=None):
+        self.conf = conf
+        self.filepath = filepath
+        #: Source linted last, with the edits made since
+        self.buffer = ''
+        # Offsets of document starts in ``buffer`` (followed by its length),
+        # and their PyYAML and yamllint line numbers
+        self.starts = [0, 0]
+        self.lines = [(0, 1)]
+        # Results by (start, end, last) in ``buffer``, with the key of the
+        # state they start in
+        self.documents = {}
+        # Documents of the last run, as (i, j, state, document) for segments
+        # from ``starts[i]`` to ``starts[j]``, without those after edits
+        self.done = []
+        #: Number of segments actually linted by the last call to ``run()``
+        self.linted = 0
+
+    def edit(self, start, end, text):
+        """Replaces ``buffer[start:end]`` with ``text``, to lint it again
+        with ``run()``.
+
+        :param start: offset of the replaced text in the buffer
+        :param end: offset of the end of the replaced text in the buffer
+        :param text: string inserted instead
+        """
+        buffer = self.buffer[:start] + text + self.buffer[end:]
+        delta = len(text) - (end - start)
+
+        # Document starts (``^---`` then a space) too far from the edit to be
+        # changed by it are kept, or moved by the length difference
+        lo, hi = max(1, start - 4), start + len(text) + 1
+        before = bisect.bisect_left(self.starts, lo, 1, len(self.starts) - 1)
+        after = bisect.bisect_right(self.starts, end + 1, before,
+                                    len(self.starts) - 1)
+        starts = self.starts[:before]
+        starts.extend(m.start() for m in DOCUMENT_START_PATTERN.finditer(
+            buffer, lo, min(len(buffer), hi + 4)) if m.start() <= hi)
+        moved = len(starts)
+        starts.extend(s + delta for s in self.starts[after:-1])
+        starts.append(len(buffer))
+
+        lines = self.lines[:before]
+        _count_lines(buffer, starts, lines, min(moved + 1, len(starts) - 1))
+        if moved < len(starts) - 1:
+            line, line_no = lines[moved]
+            line -= self.lines[after][0]
+            line_no -= self.lines[after][1]
+            lines.extend((old_line + line, old_line_no + line_no)
+                         for old_line, old_line_no in self.lines[after + 1:])
+
+        documents = {}
+        for (s, e, last), results in self.documents.items():
+            if e <= start:
+                documents[s, e, last] = results
+            elif s >= end:
+                documents[s + delta, e + delta, last] = results
+        while self.done and self.done[-1][1] >= before:
+            self.done.pop()
+
+        self.buffer, self.starts, self.lines = buffer, starts, lines
+        self.documents = documents
 
+    def run(self, buffer=None):
+        """Lints a YAML source, and returns a list of LintProblem objects.
 
-def run(input, conf, filepath=None):
+        :param buffer: buffer or string to lint, or ``None`` to lint the
+                       source linted last, with the edits made since
+        """
+        if buffer is None:
+            buffer, starts, lines = self.buffer, self.starts, self.lines
+            find = self.documents.get
+        else:
+            if isinstance(buffer, bytes):
+                buffer = decoder.auto_decode(buffer)
+            starts = [0] + [m.start() for m in
+                            DOCUMENT_START_PATTERN.finditer(buffer, 1)]
+            starts.append(len(buffer))
+            lines = [(0, 1)]
+            _count_lines(buffer, starts, lines, len(starts) - 1)
+
+            by_text = {(self.buffer[s:e], last): results
+                       for (s, e, last), results in self.documents.items()}
+
+            def find(position, default):
+                start, end, last = position
+                return by_text.get((buffer[start:end], last), default)
+
+            self.buffer, self.starts, self.lines = buffer, starts, lines
+            self.documents, self.done = {}, []
+
+        self.linted = 0
+        if ((self.filepath is not None and
+             self.conf.is_file_ignored(self.filepath)) or
+                re.match(r'^#\s*yamllint disable-file\s*$',
+                         next(parser.line_generator(buffer)).content)):
+            self.documents, self.done = {}, []
+            return []
+
+        marked_buffer = buffer + '\0'
+        documents = {}
+
+        def group_end(i):
+            # Small documents are linted together, to avoid the cost of each
+            # segment. Groups also end before documents picked by their
+            # content, to be the same again after the edits before them.
+            j = i + 1
+            while (j < len(starts) - 1 and
+                   starts[j + 1] - starts[i] <= CACHE_GROUP_SIZE and
+                   zlib.crc32(buffer[starts[j]:starts[j + 1]].encode(
+                       'utf-8', 'surrogatepass')) % 8):
+                j += 1
+            return j
+
+        def lint(i, j, state):
+            start, end = starts[i], starts[j]
+            line, line_no = lines[i]
+            position = (start, end, j == len(starts) - 1)
+            try:
+                key = state.key() if state is not None else None
+                document = next((document for k, document
+                                 in find(position, ()) if k == key), None)
+            except TypeError:  # unhashable rule context
+                key = document = None
+
+            if document is None:
+                if not position[2] and not parser.document_start_scans(
+                        buffer, end, starts[j + 1]):
+                    # The last token isn't generated in the whole buffer
+                    return None
+                # States of documents found in the cache are not moved
+                if state is not None:
+                    state = state.moved(marked_buffer, start, line, line_no)
+                segment = parser.Segment(
+                    buffer, start, end, line, line_no,
+                    first=i == 0, last=j == len(starts) - 1,
+                    prev=state.prev if state is not None else None,
+                    marked_buffer=marked_buffer)
+                self.linted += 1
+                document = _lint_segment(segment, self.conf, self.filepath,
+                                         state)
+            else:
+                document = document.moved(marked_buffer, start, line,
+                                          line_no, end_state=False)
+            if key is not None or state is None:
+                documents.setdefault(position, []).append((key, document))
+            return document
+
+        # Documents before the edits are kept as they are (the last one is
+        # looked up, when nothing changed since the last run)
+        done = list(self.done)
+        if done and done[-1][1] == len(starts) - 1:
+            done.pop()
+        for i, j, state, document in done:
+            try:
+                key = state.key() if state is not None else None
+            except TypeError:  # unhashable rule context
+                continue
+            documents.setdefault((starts[i], starts[j], False), []).append(
+                (key, document))
+        if done:
+            i, state = done[-1][1], done[-1][3].end_state
+        else:
+            i, state = 0, None
+        j = group_end(i)
+
+        while True:
+            document = lint(i, j, state)
+            if document is None:
+                j = len(starts) - 1
+            elif not document.head_ok:
+                i, _, state, _ = done.pop()
+            elif not document.tail_ok:
+                j = len(starts) - 1 if document.open_end else j + 1
+            else:
+                done.append((i, j, state, document))
+                if j == len(starts) - 1:
+                    break
+                i, j, state = j, group_end(j), document.end_state
+
+        self.documents, self.done = documents, done
+        syntax_error = next((document.syntax_error
+                             for _, _, _, document in done
+                             if document.syntax_error is not None), None)
+        return list(_insert_syntax_error(
+            (p for _, _, _, document in done for p in document.problems),
+            lambda line=None: syntax_error))
+
+
+def run_stream(stream, conf, filepath=None, chunk_size=STREAM_CHUNK_SIZE,
+               no_warnings=False):
+    """Lints a YAML stream one document at a time, without reading it whole.
+
+    Returns a generator of LintProblem objects, the same as ``run()`` does. The
+    stream is read by chunks while the generator is consumed: only the
+    documents (separated by ``---``) being linted are kept in memory, so a
+    stream of many small documents can be larger than the available memory.
+
+    :param stream: binary or text stream to read from
+    :param conf: yamllint configuration object
+    :param filepath: path of the linted file, if any
+    :param chunk_size: size of the chunks read from the stream
+    :param no_warnings: only report problems of ``error`` level (rules of
+                        ``warning`` level are not called on small streams)
+    """
+    if filepath is not None and conf.is_file_ignored(filepath):
+        return
+
+    read = decoder.stream_reader(stream)
+    text, eof = '', False
+
+    def read_more():
+        nonlocal text, eof
+        # Read more at once when a document is large, not to copy the text
+        # more than a few times
+        chunk, eof = read(max(chunk_size, len(text) - starts[-1]))
+        text += chunk
+
+    # Document starts are searched in complete lines only, ``starts`` and
+    # ``lines`` are like in DocumentCache.run(), but relative to ``text``,
+    # which only holds the end of the stream.
+    starts, lines, searched = [0], [(0, 1)], 1
+
+    while not eof and '\n' not in text:
+        read_more()
+    first_line = next(parser.line_generator(text)).content
+    if re.match(r'^#\s*yamllint disable-file\s*$', first_line):
+        return
+
+    def find_starts():
+        nonlocal searched
+        end = len(text) if eof else text.rfind('\n', searched) + 1
+        if end <= searched:
+            return
+        for match in DOCUMENT_START_PATTERN.finditer(text, searched, end):
+            line, line_no = lines[-1]
+            lines.append((
+                line + parser.yaml_line_count(text, starts[-1],
+                                              match.start()),
+                line_no + text.count('\n', starts[-1], match.start())))
+            starts.append(match.start())
+        searched = end
+
+    def read_all():
+        while not eof:
+            read_more()
+        find_starts()
+
+    def segment_end(i, j):
+        # Lint small documents together, to avoid the cost of each segment
+        while True:
+            while j >= len(starts) and not eof:
+                read_more()
+                find_starts()
+            if j >= len(starts) or starts[j] - starts[i] >= chunk_size // 4:
+                return j
+            j += 1
+
+    # Rules that can't report problems are only left out of small streams,
+    # read whole before linting
+    while not eof and len(text) < chunk_size:
+        read_more()
+        find_starts()
+    features = parser.buffer_features(text) if eof else None
+
+    if no_warnings and eof:
+        yield from _errors_only(
+            lambda leave_out: _run(text, conf, filepath, leave_out))
+        return
+
+    def documents():
+        nonlocal text, starts, lines, searched
+        done = []
+        marked_buffer = None
+        i, j, state = 0, segment_end(0, 1), None
+        while True:
+            # The next document is read too, to check its start
+            while j + 1 >= len(starts) and not eof:
+                read_more()
+                find_starts()
+            if j < len(starts) and not parser.document_start_scans(
+                    text, starts[j], starts[j + 1] if j + 1 < len(starts)
+                    else len(text)):
+                # The last token isn't generated in the whole stream
+                read_all()
+                j = len(starts)
+            if marked_buffer is None or len(marked_buffer) != len(text) + 1:
+                marked_buffer = text + '\0'
+            last = j >= len(starts)
+            line, line_no = lines[i]
+            segment = parser.Segment(
+                text, starts[i], len(text) if last else starts[j], line,
+                line_no, first=i == 0 and starts[0] == 0, last=last,
+                prev=state.prev if state is not None else None,
+                marked_buffer=marked_buffer)
+            document = _lint_segment(segment, conf, filepath, state,
+                                     features=features)
+            if not document.head_ok:
+                i, state = done.pop()[:2]
+            elif not document.tail_ok:
+                if document.open_end:
+                    read_all()
+                    j = len(starts)
+                else:
+                    j += 1
+            else:
+                done.append((i, state, document))
+                if last:
+                    break
+                i, j, state = j, segment_end(j, j + 1), document.end_state
+
+                # Keep the last document, in case the next one can't be linted
+                # without it, and drop the text before it. Linting them
+                # together gives a valid head token, unless a scanner error is
+                # found while looking ahead for the first tokens.
+                if len(done) > 1 and segment.token_count > 2:
+                    for _, _, emitted in done[:-1]:
+                        yield emitted
+                    del done[:-1]
+                    k, state_in, kept = done[0]
+                    cut = starts[k]
+                    if state_in is not None and state_in.prev is not None:
+                        cut = min(cut, state_in.prev.start_mark.pointer)
+                    # Keep the character before, for rules looking back. Only
+                    # drop text by large parts, not to copy it too often.
+                    cut -= 1
+                    if cut > 0 and cut >= len(text) // 2:
+                        text = text[cut:]
+                        marked_buffer = text + '\0'
+                        starts = [start - cut for start in starts[k:]]
+                        lines = lines[k:]
+                        searched -= cut
+                        if state_in is not None:
+                            state_in = state_in.moved(
+                                marked_buffer, state_in.pointer - cut,
+                                state_in.line, state_in.line_no)
+                        kept = kept.moved(marked_buffer, kept.pointer - cut,
+                                          kept.line, kept.line_no)
+                        done[0] = (0, state_in, kept)
+                        i, j, state = i - k, j - k, kept.end_state
+        for _, _, document in done:
+            yield document
+
+    syntax_error = None
+
+    def problems():
+        nonlocal syntax_error
+        for document in documents():
+            if syntax_error is None:
+                syntax_error = document.syntax_error
+            yield from document.problems
+
+    for problem in _insert_syntax_error(problems(),
+                                        lambda line=None: syntax_error):
+        if not no_warnings or problem.level == 'error':
+            yield problem
+
+
+def _lint_part(text, conf, filepath, start, end, lines, offset, last,
+               features, no_warnings):
+    """Lints ``text[start:end]`` in a worker process (see run_parallel()).
+
+    The linter state at ``start`` is guessed by linting the document before
+    (``text[:start]``) alone. Returns the problems and syntax error found, the
+    key of the guessed state and the state at the end of the part, or None if
+    the part can't be linted on its own.
+    """
+    marked_buffer = text + '\0'
+    state = None
+    if start > 0:
+        segment = parser.Segment(text, 0, start, *lines[0],
+                                 first=offset == 0, last=False,
+                                 marked_buffer=marked_buffer)
+        document = _lint_segment(segment, conf, filepath, None,
+                                 features=features, no_warnings=no_warnings)
+        if not document.tail_ok:
+            return None
+        state = document.end_state
+
+    segment = parser.Segment(text, start, end, *lines[1],
+                             first=offset + start == 0, last=last,
+                             prev=state.prev if state is not None else None,
+                             marked_buffer=marked_buffer)
+    document = _lint_segment(segment, conf, filepath, state,
+                             features=features, no_warnings=no_warnings)
+    if not (document.head_ok and document.tail_ok):
+        return None
+
+    # Lazy descriptions and marks (with the text) are not sent back
+    end_state = document.end_state
+    if end_state is not None:
+        end_state.key()
+        end_state = end_state.moved(None, end_state.pointer + offset,
+                                    end_state.line, end_state.line_no)
+    for problem in document.problems + (end_state.cache if end_state else []):
+        problem.desc = problem.desc
+    return (document.problems, document.syntax_error,
+            state.key() if state is not None else None, end_state)
+
+
+def run_parallel(buffer, conf, filepath=None, jobs=None, no_warnings=False):
+    """Lints a YAML source in several processes.
+
+    Returns a list of LintProblem objects, the same as ``run()`` would. The
+    source is split in parts made of whole documents (separated by ``---``),
+    linted in parallel from the state found by linting the document before
+    them alone. The parts that don't start in the state the previous part ends
+    in are linted again, so it is faster when documents are independent.
+
+    :param buffer: buffer or string to lint
+    :param conf: yamllint configuration object
+    :param filepath: path of the linted file, if any
+    :param jobs: number of processes to use (defaults to the number of CPUs)
+    :param no_warnings: only report problems of ``error`` level (rules of
+                        ``warning`` level are not called)
+    """
+    if filepath is not None and conf.is_file_ignored(filepath):
+        return []
+    if isinstance(buffer, bytes):
+        buffer = decoder.auto_decode(buffer)
+    if re.match(r'^#\s*yamllint disable-file\s*$',
+                next(parser.line_generator(buffer)).content):
+        return []
+
+    if no_warnings:
+        return list(_errors_only(
+            lambda leave_out: _run_parallel(buffer, conf, filepath, jobs,
+                                            leave_out)))
+    return _run_parallel(buffer, conf, filepath, jobs)
+
+
+def _run_parallel(buffer, conf, filepath, jobs, no_warnings=False):
+    jobs = jobs or os.cpu_count() or 1
+    starts = [0] + [m.start() for m in
+                    DOCUMENT_START_PATTERN.finditer(buffer, 1)]
+    lines = [(0, 1)]
+    _count_lines(buffer, starts, lines, len(starts))
+
+    # Several parts per process, in case some take longer
+    size = max(len(buffer) // (jobs * 4), PARALLEL_PART_SIZE)
+    bounds = [0]
+    for i, start in enumerate(starts):
+        if start - starts[bounds[-1]] >= size:
+            bounds.append(i)
+    if jobs == 1 or len(bounds) == 1:
+        return list(_run(buffer, conf, filepath, no_warnings))
+    bounds.append(len(starts))
+    starts.append(len(buffer))
+    # Without the tokens after a part, the last one of the part isn't
+    # generated in the whole buffer
+    if not all(parser.document_start_scans(buffer, starts[e], starts[e + 1])
+               for e in bounds[1:-1]):
+        return list(_run(buffer, conf, filepath, no_warnings))
+
+    features = parser.buffer_features(buffer)
+    parts = []
+    for b, e in zip(bounds, bounds[1:]):
+        w = max(b - 1, 0)  # the document before, to guess the state
+        # Rules may look at the next line, after the part
+        end = buffer.find('\n', starts[e]) + 1 or len(buffer)
+        parts.append((buffer[starts[w]:end], conf, filepath,
+                      starts[b] - starts[w], starts[e] - starts[w],
+                      (lines[w], lines[b]), starts[w],
+                      e == len(starts) - 1, features, no_warnings))
+    try:
+        with concurrent.futures.ProcessPoolExecutor(jobs) as executor:
+            results = list(executor.map(_lint_part, *zip(*parts)))
+    except Exception:  # e.g. a rule context that can't be pickled
+        results = [None]
+
+    marked_buffer = buffer + '\0'
+    problems, syntax_error, state = [], None, None
+    for b, e, result in zip(bounds, bounds[1:], results):
+        if result is None:
+            return list(_run(buffer, conf, filepath, no_warnings))
+        part_problems, part_syntax_error, key, end_state = result
+        if state is not None and key != state.key():
+            # The part doesn't start in the guessed state, lint it again
+            state = state.moved(marked_buffer, state.pointer, state.line,
+                                state.line_no)
+            segment = parser.Segment(
+                buffer, starts[b], starts[e], *lines[b], first=False,
+                last=e == len(starts) - 1, prev=state.prev,
+                marked_buffer=marked_buffer)
+            document = _lint_segment(segment, conf, filepath, state,
+                                     features=features,
+                                     no_warnings=no_warnings)
+            if not (document.head_ok and document.tail_ok):
+                return list(_run(buffer, conf, filepath, no_warnings))
+            part_problems = document.problems
+            part_syntax_error = document.syntax_error
+            end_state = document.end_state
+        problems.extend(part_problems)
+        if syntax_error is None:
+            syntax_error = part_syntax_error
+        state = end_state
+
+    return list(_insert_syntax_error(problems,
+                                     lambda line=None: syntax_error,
+                                     no_warnings))
+
+
+def run(input, conf, filepath=None, no_warnings=False):
     """Lints a YAML source.
 
     Returns a generator of LintProblem objects.
 
     :param input: buffer, string or stream to read from
     :param conf: yamllint configuration object
+    :param no_warnings: only report problems of ``error`` level (rules of
+                        ``warning`` level are not called)
     """
     if filepath is not None and conf.is_file_ignored(filepath):
         return ()
 
     if isinstance(input, (bytes, str)):
-        return _run(input, conf, filepath)
+        content = input
     elif isinstance(input, io.IOBase):
         # We need to have everything in memory to parse correctly
         content = input.read()
-        return _run(content, conf, filepath)
     else:
         raise TypeError('input should be a string or a stream')
+
+    if no_warnings:
+        return _errors_only(
+            lambda leave_out: _run(content, conf, filepath, leave_out))
+    return _run(content, conf, filepath)
+
+
+def run_syntax(input, conf, filepath=None):
+    """Only checks the syntax of a YAML source, without cosmetic rules.
+
+    Returns a list with the syntax error, if any, as ``run()`` reports it.
+
+    :param input: buffer, string or stream to read from
+    :param conf: yamllint configuration object
+    """
+    if filepath is not None and conf.is_file_ignored(filepath):
+        return []
+
+    if isinstance(input, io.IOBase):
+        input = input.read()
+    elif not isinstance(input, (bytes, str)):
+        raise TypeError('input should be a string or a stream')
+    if isinstance(input, bytes):
+        input = decoder.auto_decode(input)
+
+    first_line = next(parser.line_generator(input)).content
+    if re.match(r'^#\s*yamllint disable-file\s*$', first_line):
+        return []
+
+    syntax_error = get_syntax_error(input)
+    return [] if syntax_error is None else [syntax_error]
+
+
+def get_facts(buffer, conf, filepath=None):
+    """Returns the facts that project rules record about a file, by rule ID.
+
+    Project rules (``TYPE = 'project'``) find problems across files. Their
+    ``map(conf, event, facts)`` function is called with the events of each
+    file, and records what it needs in ``facts`` (a dict). Their
+    ``reduce(conf, facts)`` function is then called with the facts of all
+    files, by file path, and yields ``(filepath, LintProblem)`` pairs (see
+    ``run_project()``).
+    """
+    if filepath is not None and conf.is_file_ignored(filepath):
+        return {}
+    plan = lint_plan(conf, filepath)
+    if not plan.project_rules:
+        return {}
+    if isinstance(buffer, bytes):
+        buffer = decoder.auto_decode(buffer)
+    if re.match(r'^#\s*yamllint disable-file\s*$',
+                next(parser.line_generator(buffer)).content):
+        return {}
+
+    facts = {rule.ID: {} for rule, _ in plan.project_rules}
+
+    def map_event(event):
+        for rule, rule_conf in plan.project_rules:
+            rule.map(rule_conf, event, facts[rule.ID])
+
+    # Files with syntax errors give the facts found before the error
+    syntax_checker = SyntaxChecker(parser.token_stream(buffer))
+    syntax_checker.on_event = map_event
+    syntax_checker.advance()
+    return facts
+
+
+def _disabled_lines(buffer, rule_ids):
+    """Finds the rules that directives disable, on each line of a buffer.
+
+    Returns two lists: line numbers, and the set of rules (among
+    ``rule_ids``) disabled from each of these lines until the next one.
+    """
+    lines, rules = [1], [frozenset()]
+    directives = directive_pointers(buffer)
+    if not directives:
+        return lines, rules
+
+    disabled = DisableDirective(rule_ids)
+    disabled_for_line = DisableLineDirective(rule_ids)
+    disabled_for_next_line = DisableLineDirective(rule_ids)
+    for elem in parser.token_or_comment_or_line_generator(buffer):
+        if isinstance(elem, parser.Comment):
+            if elem.pointer in directives:
+                comment = str(elem)
+                disabled.process_comment(comment)
+                if elem.is_inline():
+                    disabled_for_line.process_comment(comment)
+                else:
+                    disabled_for_next_line.process_comment(comment)
+        elif isinstance(elem, parser.Line):
+            line_rules = frozenset(disabled.rules | disabled_for_line.rules)
+            if line_rules != rules[-1]:
+                lines.append(elem.line_no)
+                rules.append(line_rules)
+            disabled_for_line.rules = disabled_for_next_line.rules
+            disabled_for_next_line.rules = set()
+    return lines, rules
+
+
+def _read_facts(filepath, conf):
+    """Returns the facts of a file, and where directives disable project
+    rules in it."""
+    with open(filepath, 'rb') as f:
+        buffer = decoder.auto_decode(f.read())
+    facts = get_facts(buffer, conf, filepath)
+    if not facts:
+        return facts, ([1], [frozenset()])
+    return facts, _disabled_lines(buffer, set(facts))
+
+
+def _file_stamp(filepath):
+    stat = os.stat(filepath)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def run_project(filepaths, conf, jobs=1, cache=None):
+    """Runs project rules on files, to find problems across them.
+
+    Returns a dict of lists of LintProblem objects, by file path. Facts are
+    recorded in each file (see ``get_facts()``), in ``jobs`` processes, then
+    reduced together. Problems on lines where directives disable a rule are
+    left out, like problems in files not in ``filepaths``.
+
+    :param filepaths: paths of the files of the project
+    :param conf: yamllint configuration object
+    :param jobs: number of processes to use (None for the number of CPUs)
+    :param cache: dict that keeps the facts of files between runs, so that
+                  only the files modified since are read again
+    """
+    rules = {}
+    for filepath in filepaths:
+        if not conf.is_file_ignored(filepath):
+            for rule, rule_conf in lint_plan(conf, filepath).project_rules:
+                rules[rule.ID] = rule, rule_conf
+    problems = {filepath: [] for filepath in filepaths}
+    if not rules:
+        return problems
+
+    if cache is None:
+        cache = {}
+    stamps = {filepath: _file_stamp(filepath) for filepath in filepaths}
+    modified = [filepath for filepath in filepaths
+                if cache.get(filepath, (None,))[0] != stamps[filepath]]
+    if (jobs or os.cpu_count() or 1) != 1 and len(modified) > 1:
+        with concurrent.futures.ProcessPoolExecutor(jobs) as executor:
+            facts = list(executor.map(_read_facts, modified,
+                                      [conf] * len(modified)))
+    else:
+        facts = [_read_facts(filepath, conf) for filepath in modified]
+    for filepath, (file_facts, disabled) in zip(modified, facts):
+        cache[filepath] = stamps[filepath], file_facts, disabled
+
+    for rule, rule_conf in rules.values():
+        rule_facts = {filepath: cache[filepath][1][rule.ID]
+                      for filepath in filepaths
+                      if rule.ID in cache[filepath][1]}
+        for filepath, problem in rule.reduce(rule_conf, rule_facts):
+            # Problems in files that are not linted are left out, like
+            # those disabled by directives
+            if filepath not in rule_facts:
+                continue
+            lines, disabled = cache[filepath][2]
+            if rule.ID in disabled[bisect.bisect_right(lines,
+                                                       problem.line) - 1]:
+                continue
+            problem.rule = rule.ID
+            problem.level = rule_conf['level']
+            problems[filepath].append(problem)
+    for file_problems in problems.values():
+        file_problems.sort(key=lambda problem: (problem.line, problem.column))
+    return problems
@@ -0,0 +1,312 @@
+# Copyright (C) 2026 agent
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Language Server Protocol server, over standard input and output.
+
+Started with ``yamllint --lsp``. Documents are synchronized incrementally, and
+diagnostics are published after each change. Only the YAML documents (``---``)
+affected by a change are linted again (see ``linter.DocumentCache``).
+"""
+
+import itertools
+import json
+import os
+import queue
+import re
+import sys
+import threading
+import urllib.parse
+import urllib.request
+
+import yaml
+
+from yamllint import APP_NAME, APP_VERSION, linter
+
+SEVERITIES = {'error': 1, 'warning': 2}
+
+PARSE_ERROR = -32700
+METHOD_NOT_FOUND = -32601
+INTERNAL_ERROR = -32603
+REQUEST_CANCELLED = -32800
+
+LINE_BREAK = re.compile(r'\r\n|\r|\n')
+ASTRAL_CHAR = re.compile('[\U00010000-\U0010ffff]')
+
+
+def read_message(stream):
+    """Reads a JSON-RPC message, returns None at the end of the stream."""
+    length = None
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            if length is not None:
+                break
+            continue
+        name, _, value = line.partition(b':')
+        if name.strip().lower() == b'content-length':
+            length = int(value)
+    return json.loads(stream.read(length).decode('utf-8'))
+
+
+def write_message(stream, message):
+    body = json.dumps(message).encode('utf-8')
+    stream.write(b'Content-Length: %d\r\n\r\n' % len(body) + body)
+    stream.flush()
+
+
+def utf16_length(text):
+    return len(text) + len(ASTRAL_CHAR.findall(text))
+
+
+def utf16_to_index(text, units):
+    """Converts a number of UTF-16 code units to an index in a string."""
+    if not ASTRAL_CHAR.search(text, 0, units):
+        return min(units, len(text))
+    index = 0
+    while index < len(text) and units > 0:
+        units -= 2 if ord(text[index]) > 0xffff else 1
+        index += 1
+    return index
+
+
+def uri_to_path(uri):
+    parsed = urllib.parse.urlparse(uri)
+    if parsed.scheme != 'file':
+        return None
+    path = urllib.request.url2pathname(parsed.path)
+    if os.path.abspath(path).startswith(os.getcwd() + os.sep):
+        path = os.path.relpath(path)
+    return path
+
+
+class Document:
+    """An open text document, linted again after each change."""
+    def __init__(self, uri, text, version, conf):
+        self.uri = uri
+        self.text = text
+        self.version = version
+        self.linted = False
+        self.cache = linter.DocumentCache(conf, uri_to_path(uri))
+        # Whether the text was replaced whole, instead of edited by ranges
+        self.replaced = True
+
+    def offset(self, position):
+        """Converts a LSP position to an index in the text."""
+        start = 0
+        if position['line'] > 0:
+            match = next(itertools.islice(LINE_BREAK.finditer(self.text),
+                                          position['line'] - 1, None), None)
+            if match is None:
+                return len(self.text)
+            start = match.end()
+        match = LINE_BREAK.search(self.text, start)
+        end = match.start() if match else len(self.text)
+        return start + utf16_to_index(self.text[start:end],
+                                      position['character'])
+
+    def change(self, change):
+        if 'range' not in change:
+            self.text = change['text']
+            self.replaced = True
+        else:
+            start = self.offset(change['range']['start'])
+            end = max(start, self.offset(change['range']['end']))
+            self.text = self.text[:start] + change['text'] + self.text[end:]
+            if not self.replaced:
+                self.cache.edit(start, end, change['text'])
+        self.linted = False
+
+    def diagnostics(self):
+        try:
+            problems = self.cache.run(self.text if self.replaced else None)
+            self.replaced = False
+        except Exception as e:
+            # e.g. non-printable characters, or a rule that fails on this
+            # text: the error is reported, and other documents still linted
+            if isinstance(e, yaml.YAMLError):
+                desc = f'syntax error: {e}'
+            else:
+                desc = f'linting failed: {type(e).__name__}: {e}'
+            problems = [linter.LintProblem(1, 1, desc)]
+            problems[0].level = 'error'
+            # The cache may be left in the middle of a run: lint the whole
+            # text next time
+            self.replaced = True
+        self.linted = True
+
+        lines = None
+        if ASTRAL_CHAR.search(self.text):
+            lines = self.text.split('\n')
+
+        diagnostics = []
+        for problem in problems:
+            character = problem.column - 1
+            if lines is not None and problem.line <= len(lines):
+                character = utf16_length(
+                    lines[problem.line - 1][:problem.column - 1])
+            position = {'line': problem.line - 1, 'character': character}
+            diagnostic = {'range': {'start': position, 'end': position},
+                          'severity': SEVERITIES[problem.level],
+                          'source': APP_NAME,
+                          'message': problem.desc}
+            if problem.rule is not None:
+                diagnostic['code'] = problem.rule
+            diagnostics.append(diagnostic)
+        return diagnostics
+
+
+class LanguageServer:
+    """Language server reading requests from ``input`` (a binary stream) and
+    writing responses to ``output``."""
+    def __init__(self, conf, input, output):
+        self.conf = conf
+        self.input = input
+        self.output = output
+        self.documents = {}
+        self.messages = queue.Queue()
+        self.shutdown = False
+        self.handlers = {
+            'initialize': self.initialize,
+            'shutdown': self.handle_shutdown,
+            'textDocument/didOpen': self.did_open,
+            'textDocument/didChange': self.did_change,
+            'textDocument/didClose': self.did_close,
+        }
+
+    def read(self):
+        while True:
+            try:
+                message = read_message(self.input)
+            except ValueError as e:
+                message = {'error': str(e)}
+            if message is not None and not isinstance(message, dict):
+                message = {'error': 'message is not an object'}
+            self.messages.put(message)
+            if message is None or message.get('method') == 'exit':
+                break
+
+    def serve(self):
+        """Serves until the client exits, and returns the exit code."""
+        threading.Thread(target=self.read).start()
+
+        while True:
+            messages = [self.messages.get()]
+            while not self.messages.empty():
+                messages.append(self.messages.get_nowait())
+
+            # Requests cancelled before being handled are not handled at all
+            cancelled = {message['params'].get('id') for message in messages
+                         if message is not None and
+                         message.get('method') == '$/cancelRequest' and
+                         isinstance(message.get('params'), dict)}
+
+            for message in messages:
+                if message is None:
+                    return 1
+                elif message.get('method') == 'exit':
+                    return 0 if self.shutdown else 1
+                self.handle(message, cancelled)
+
+            self.publish_diagnostics()
+
+    def handle(self, message, cancelled):
+        """Handles a message. A request that fails gets an internal error
+        response, and a notification that fails is logged."""
+        try:
+            self.dispatch(message, cancelled)
+        except Exception as e:
+            error = f'{message.get("method")} failed: {type(e).__name__}: {e}'
+            if 'id' in message:
+                self.respond(message['id'], error=(INTERNAL_ERROR, error))
+            else:
+                self.notify('window/logMessage', {'type': 1,
+                                                  'message': error})
+
+    def dispatch(self, message, cancelled):
+        if 'error' in message and 'method' not in message:
+            if 'id' not in message:  # not a response, but an invalid message
+                self.respond(None, error=(PARSE_ERROR, message['error']))
+            return
+
+        handler = self.handlers.get(message.get('method'))
+        if 'id' not in message:  # notification
+            if handler is not None:
+                handler(message.get('params', {}))
+        elif message['id'] in cancelled:
+            self.respond(message['id'],
+                         error=(REQUEST_CANCELLED, 'request cancelled'))
+        elif handler is None:
+            self.respond(message['id'], error=(
+                METHOD_NOT_FOUND, f'unknown method {message.get("method")}'))
+        else:
+            self.respond(message['id'], handler(message.get('params', {})))
+
+    def respond(self, id, result=None, error=None):
+        message = {'jsonrpc': '2.0', 'id': id}
+        if error is not None:
+            message['error'] = {'code': error[0], 'message': error[1]}
+        else:
+            message['result'] = result
+        write_message(self.output, message)
+
+    def notify(self, method, params):
+        write_message(self.output,
+                      {'jsonrpc': '2.0', 'method': method, 'params': params})
+
+    def publish_diagnostics(self):
+        for document in list(self.documents.values()):
+            # Don't lint a version that newer changes will make outdated
+            if not self.messages.empty():
+                return
+            if not document.linted:
+                self.notify('textDocument/publishDiagnostics', {
+                    'uri': document.uri,
+                    'version': document.version,
+                    'diagnostics': document.diagnostics()})
+
+    def initialize(self, params):
+        return {'capabilities': {'textDocumentSync': {'openClose': True,
+                                                      'change': 2}},
+                'serverInfo': {'name': APP_NAME, 'version': APP_VERSION}}
+
+    def handle_shutdown(self, params):
+        self.shutdown = True
+
+    def did_open(self, params):
+        item = params['textDocument']
+        self.documents[item['uri']] = Document(item['uri'], item['text'],
+                                               item.get('version'), self.conf)
+
+    def did_change(self, params):
+        document = self.documents.get(params['textDocument']['uri'])
+        if document is None:
+            return
+        document.version = params['textDocument'].get('version')
+        for change in params['contentChanges']:
+            document.change(change)
+
+    def did_close(self, params):
+        uri = params['textDocument']['uri']
+        if self.documents.pop(uri, None) is not None:
+            self.notify('textDocument/publishDiagnostics',
+                        {'uri': uri, 'diagnostics': []})
+
+
+def serve(conf):
+    """Runs a language server on standard input and output."""
+    return LanguageServer(conf, sys.stdin.buffer, sys.stdout.buffer).serve()
@@ -13,10 +13,19 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import array
+import bisect
+import collections
+import re
+
 import yaml
 
+LINE_INDENT = re.compile('^ *', re.MULTILINE)
+
 
 class Line:
+    __slots__ = ('line_no', 'start', 'end', 'buffer')
+
     def __init__(self, line_no, buffer, start, end):
         self.line_no = line_no
         self.start = start
@@ -28,7 +37,83 @@ class Line:
         return self.buffer[self.start:self.end]
 
 
+class LineIndex:
+    """Start offsets and indents of the lines of a buffer, to find the line
+    of a position in O(log n) instead of scanning the buffer.
+
+    Only the lines from the one of ``start`` to ``end`` are indexed, when the
+    index is first used. They are numbered from ``line_no``, like yamllint
+    does (starting at 1), and split at '\\n' only.
+    """
+    def __init__(self, buffer, start=0, end=None, line_no=1):
+        self.buffer = buffer
+        self.first = buffer.rfind('\n', 0, start) + 1
+        self.end = len(buffer) if end is None else end
+        self.first_line_no = line_no
+        self._starts = None
+        self._indents = None
+
+    def _build(self):
+        self._starts = array.array('q')
+        self._indents = array.array('q')
+        for match in LINE_INDENT.finditer(self.buffer, self.first, self.end):
+            self._starts.append(match.start())
+            self._indents.append(match.end() - match.start())
+
+    @property
+    def starts(self):
+        if self._starts is None:
+            self._build()
+        return self._starts
+
+    def line_no(self, pointer):
+        """Returns the line of a position in the buffer."""
+        return bisect.bisect_right(self.starts, pointer) + \
+            self.first_line_no - 1
+
+    def start(self, line_no):
+        return self.starts[line_no - self.first_line_no]
+
+    def indent(self, line_no):
+        """Returns the number of spaces at the start of a line."""
+        if self._indents is None:
+            self._build()
+        return self._indents[line_no - self.first_line_no]
+
+
+def line_index(mark):
+    """Returns a LineIndex of the lines around a mark.
+
+    Tokens of a TokenStream share the index of the lines it scans, built once
+    for the rules that need it. For other marks, only the line of the mark is
+    indexed.
+    """
+    index = getattr(mark, 'line_index', None)
+    if index is None:
+        end = mark.buffer.find('\n', mark.pointer)
+        index = LineIndex(mark.buffer, mark.pointer,
+                          len(mark.buffer) if end == -1 else end,
+                          mark.line + 1)
+    return index
+
+
+#: Characters looked for by ``buffer_features()``
+FEATURE_CHARACTERS = '#&*{}[],\'"0'
+
+
+def buffer_features(buffer):
+    """Returns the set of FEATURE_CHARACTERS found in a buffer.
+
+    Rules that define ``applies(conf, features)`` are left out of the linting
+    of buffers they can't report problems on.
+    """
+    return frozenset(c for c in FEATURE_CHARACTERS if c in buffer)
+
+
 class Token:
+    """A token (``curr``) with the tokens before and after it."""
+    __slots__ = ('line_no', 'curr', 'prev', 'next', 'nextnext')
+
     def __init__(self, line_no, curr, prev, next, nextnext):
         self.line_no = line_no
         self.curr = curr
@@ -38,6 +123,9 @@ class Token:
 
 
 class Comment:
+    __slots__ = ('line_no', 'column_no', 'buffer', 'pointer', 'token_before',
+                 'token_after', 'comment_before', '_text', '_inline')
+
     def __init__(self, line_no, column_no, buffer, pointer,
                  token_before=None, token_after=None, comment_before=None):
         self.line_no = line_no
@@ -47,14 +135,19 @@ class Comment:
         self.token_before = token_before
         self.token_after = token_after
         self.comment_before = comment_before
+        self._text = None
+        self._inline = None
 
     def __str__(self):
-        end = self.buffer.find('\n', self.pointer)
-        if end == -1:
-            end = self.buffer.find('\0', self.pointer)
-        if end != -1:
-            return self.buffer[self.pointer:end]
-        return self.buffer[self.pointer:]
+        if self._text is None:
+            end = self.buffer.find('\n', self.pointer)
+            if end == -1:
+                end = self.buffer.find('\0', self.pointer)
+            if end != -1:
+                self._text = self.buffer[self.pointer:end]
+            else:
+                self._text = self.buffer[self.pointer:]
+        return self._text
 
     def __eq__(self, other):
         return (isinstance(other, Comment) and
@@ -63,74 +156,393 @@ class Comment:
                 str(self) == str(other))
 
     def is_inline(self):
-        return (
-            not isinstance(self.token_before, yaml.StreamStartToken) and
-            self.line_no == self.token_before.end_mark.line + 1 and
-            # sometimes token end marks are on the next line
-            self.buffer[self.token_before.end_mark.pointer - 1] != '\n'
-        )
-
-
-def line_generator(buffer):
-    line_no = 1
-    cur = 0
-    next = buffer.find('\n')
+        if self._inline is None:
+            self._inline = (
+                not isinstance(self.token_before, yaml.StreamStartToken) and
+                self.line_no == self.token_before.end_mark.line + 1 and
+                # sometimes token end marks are on the next line
+                self.buffer[self.token_before.end_mark.pointer - 1] != '\n'
+            )
+        return self._inline
+
+
+class Collection:
+    """A mapping or a sequence that contains tokens (see ``Nesting``)."""
+    def __init__(self, type, flow):
+        #: ``Nesting.MAP`` or ``Nesting.SEQ``
+        self.type = type
+        #: Whether the collection is in flow style (``{}`` or ``[]``)
+        self.flow = flow
+        #: Whether the next node of the mapping is a key, rather than a value
+        self.key = False
+        #: Data of token rules about the collection, by rule ID
+        self.data = {}
+
+
+class Nesting:
+    """Collections that contain the current token, from the outermost.
+
+    The linter updates it once per token, before calling token rules that
+    declare ``NESTING = True``, and gives it to them as ``context['nesting']``.
+    """
+    MAP, SEQ = range(2)
+
+    START_TOKENS = {
+        yaml.BlockMappingStartToken: (MAP, False),
+        yaml.FlowMappingStartToken: (MAP, True),
+        yaml.BlockSequenceStartToken: (SEQ, False),
+        yaml.FlowSequenceStartToken: (SEQ, True),
+    }
+    END_TOKENS = (yaml.BlockEndToken, yaml.FlowMappingEndToken,
+                  yaml.FlowSequenceEndToken)
+
+    def __init__(self):
+        self.stack = []
+        #: Number of flow collections opened, and not closed yet
+        self.flow_level = 0
+
+    @property
+    def depth(self):
+        return len(self.stack)
+
+    @property
+    def parent(self):
+        """The innermost collection, or None at the root of a document."""
+        return self.stack[-1] if self.stack else None
+
+    def update(self, token):
+        token_type = type(token)
+        if token_type in self.START_TOKENS:
+            collection_type, flow = self.START_TOKENS[token_type]
+            self.stack.append(Collection(collection_type, flow))
+            self.flow_level += flow
+        elif token_type in self.END_TOKENS:
+            # Closing indicators are scanned even when nothing is open
+            if self.stack:
+                self.stack.pop()
+            if token_type is not yaml.BlockEndToken:
+                self.flow_level -= 1
+        elif self.stack:
+            if token_type is yaml.KeyToken:
+                self.stack[-1].key = True
+            elif token_type in (yaml.ValueToken, yaml.BlockEntryToken,
+                                yaml.FlowEntryToken):
+                self.stack[-1].key = False
+
+
+class Segment:
+    """Part of a buffer that starts at a YAML document start (``---``).
+
+    Tokens, comments and lines of a segment are generated as if the whole
+    buffer was read, with positions relative to ``buffer``. This allows
+    linting a stream one document at a time (see ``yamllint.linter``).
+
+    After generating tokens, ``complete`` tells whether the scanner reached the
+    end of the segment, ``flow_level`` is its flow level there and ``head`` and
+    ``tail`` are the first and last tokens generated, and ``token_count`` how
+    many there are.
+    """
+    def __init__(self, buffer, start, end, line=0, line_no=1,
+                 first=True, last=True, prev=None, marked_buffer=None):
+        self.buffer = buffer
+        #: ``buffer`` followed by '\\0', like PyYAML marks expect it
+        self.marked_buffer = marked_buffer or buffer + '\0'
+        self.start = start
+        self.end = end
+        #: Line of ``start``, as counted by PyYAML (starting at 0)
+        self.line = line
+        #: Line of ``start``, as counted by yamllint (starting at 1)
+        self.line_no = line_no
+        #: Whether the segment starts the stream (and ends it, for ``last``)
+        self.first = first
+        self.last = last
+        #: Last token of the previous segment
+        self.prev = prev
+
+        self.complete = False
+        self.flow_level = 0
+        self.head = None
+        self.tail = None
+        self.token_count = 0
+        #: Linter state at the end of the segment (see ``yamllint.linter``)
+        self.end_state = None
+
+
+class SegmentLoader(yaml.BaseLoader):
+    """Loader that reads a segment only, but marks positions in the buffer."""
+    def __init__(self, segment):
+        self.segment_buffer = segment.marked_buffer
+        self.segment_start = segment.start
+        self.segment_line = segment.line
+        super().__init__(segment.buffer[segment.start:segment.end])
+
+    def get_mark(self):
+        return yaml.Mark(self.name, self.index + self.segment_start,
+                         self.line + self.segment_line, self.column,
+                         self.segment_buffer,
+                         self.pointer + self.segment_start)
+
+
+def document_start_scans(buffer, start, end):
+    """Tells whether the document start at ``start`` and the token after it
+    can be scanned, reading ``buffer[start:end]`` only.
+
+    Tokens are generated with the next two ones: when these can't be scanned,
+    the last token of the segment that ends at ``start`` isn't generated when
+    reading the whole buffer.
+    """
+    loader = yaml.BaseLoader(buffer[start:end])
+    try:
+        loader.get_token()  # stream start
+        loader.get_token()  # document start
+        loader.peek_token()
+    except yaml.scanner.ScannerError:
+        return False
+    return True
+
+
+def yaml_line_count(buffer, start=0, end=None):
+    """Counts line breaks like PyYAML does (it's not only \\n)."""
+    if end is None:
+        end = len(buffer)
+    return (buffer.count('\n', start, end) +
+            buffer.count('\r', start, end) -
+            buffer.count('\r\n', start, end) -
+            (end > start and buffer[end - 1] == '\r' and
+             buffer[end:end + 1] == '\n') +
+            buffer.count('\x85', start, end) +
+            buffer.count('\u2028', start, end) +
+            buffer.count('\u2029', start, end))
+
+
+def line_generator(buffer, segment=None, window=None):
+    """Generates the lines of a buffer, or of a segment of it.
+
+    When a ``window`` Line is given, it is moved from line to line and
+    yielded each time, instead of a new Line per line.
+    """
+    if segment is None:
+        line_no, cur, end = 1, 0, len(buffer)
+    else:
+        line_no, cur, end = segment.line_no, segment.start, segment.end
+
+    line = window
+    if window is not None:
+        window.buffer = buffer
+    next = buffer.find('\n', cur, end)
     while next != -1:
+        content_end = next
         if next > 0 and buffer[next - 1] == '\r':
-            yield Line(line_no, buffer, start=cur, end=next - 1)
+            content_end = next - 1
+        if window is None:
+            line = Line(line_no, buffer, cur, content_end)
         else:
-            yield Line(line_no, buffer, start=cur, end=next)
+            line.line_no, line.start, line.end = line_no, cur, content_end
+        yield line
         cur = next + 1
-        next = buffer.find('\n', cur)
+        next = buffer.find('\n', cur, end)
         line_no += 1
 
-    yield Line(line_no, buffer, start=cur, end=len(buffer))
+    # A segment that isn't the last one ends with a line break
+    if segment is None or segment.last:
+        if window is None:
+            line = Line(line_no, buffer, cur, len(buffer))
+        else:
+            line.line_no, line.start, line.end = line_no, cur, len(buffer)
+        yield line
 
 
 def comments_between_tokens(token1, token2):
     """Find all comments between two tokens"""
+    buffer = token1.end_mark.buffer
     if token2 is None:
-        buf = token1.end_mark.buffer[token1.end_mark.pointer:]
+        end = len(buffer)
     elif (token1.end_mark.line == token2.start_mark.line and
           not isinstance(token1, yaml.StreamStartToken) and
           not isinstance(token2, yaml.StreamEndToken)):
         return
     else:
-        buf = token1.end_mark.buffer[token1.end_mark.pointer:
-                                     token2.start_mark.pointer]
+        end = token2.start_mark.pointer
 
     line_no = token1.end_mark.line + 1
+    # Column of ``line_start`` (only the first line doesn't start at 0)
     column_no = token1.end_mark.column + 1
-    pointer = token1.end_mark.pointer
+    line_start = token1.end_mark.pointer
 
     comment_before = None
-    for line in buf.split('\n'):
-        pos = line.find('#')
-        if pos != -1:
-            comment = Comment(line_no, column_no + pos,
-                              token1.end_mark.buffer, pointer + pos,
-                              token1, token2, comment_before)
-            yield comment
+    pointer = buffer.find('#', line_start, end)
+    while pointer != -1:
+        line_breaks = buffer.count('\n', line_start, pointer)
+        if line_breaks:
+            line_no += line_breaks
+            column_no = 1
+            line_start = buffer.rfind('\n', line_start, pointer) + 1
+
+        comment = Comment(line_no, column_no + pointer - line_start, buffer,
+                          pointer, token1, token2, comment_before)
+        yield comment
 
-            comment_before = comment
+        comment_before = comment
 
-        pointer += len(line) + 1
+        # Other '#' on the same line are part of the comment
+        line_start = buffer.find('\n', pointer, end) + 1
+        if line_start == 0:
+            break
         line_no += 1
         column_no = 1
+        pointer = buffer.find('#', line_start, end)
+
+
+class TokenStream:
+    """Tokens of a YAML scanner, read in turn by several readers.
+
+    This allows scanning a buffer only once, for both the rules and the syntax
+    check. Readers must be created before tokens are read.
+
+    If ``line_index`` is given, it is set on the start mark of each token (see
+    ``line_index()``).
+    """
+    def __init__(self, scanner, line_index=None):
+        self.scanner = scanner
+        self.line_index = line_index
+        self.readers = []
+        #: Last token scanned (next ones cannot start before it)
+        self.last = None
+        self.error = None
+
+    def reader(self):
+        reader = TokenReader(self)
+        self.readers.append(reader)
+        return reader
+
+    def fetch(self):
+        """Scans a token for all readers, returns False at the stream end.
+
+        Raises the scanner error (again) if one was found.
+        """
+        if self.error is None:
+            try:
+                if not self.scanner.check_token():
+                    return False
+                self.last = self.scanner.get_token()
+            except yaml.scanner.ScannerError as e:
+                self.error = e
+        if self.error is not None:
+            raise self.error
+        if self.line_index is not None:
+            self.last.start_mark.line_index = self.line_index
+
+        for reader in self.readers:
+            reader.tokens.append(self.last)
+            if (reader.on_backlog is not None and
+                    len(reader.tokens) >= TokenReader.BACKLOG):
+                reader.on_backlog()
+        return True
+
+
+class TokenReader:
+    """Reads tokens from a TokenStream, with the same methods as a scanner."""
+    BACKLOG = 1024
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.tokens = collections.deque()
+        #: Called when more than BACKLOG tokens wait to be read
+        self.on_backlog = None
+
+    def check_token(self, *choices):
+        while not self.tokens and self.stream.fetch():
+            pass
+        if self.tokens:
+            return not choices or isinstance(self.tokens[0], choices)
+        return False
+
+    def peek_token(self):
+        if self.check_token():
+            return self.tokens[0]
+
+    def get_token(self):
+        if self.check_token():
+            return self.tokens.popleft()
+
+
+def token_stream(buffer, segment=None):
+    """Returns a TokenStream of ``buffer``, or of a segment of it, with the
+    index of the lines it scans."""
+    if segment is None:
+        loader = yaml.BaseLoader(buffer)
+        return TokenStream(loader, LineIndex(loader.buffer, 0, len(buffer)))
+    return TokenStream(SegmentLoader(segment),
+                       LineIndex(segment.marked_buffer, segment.start,
+                                 segment.end, segment.line_no))
+
+
+def token_or_comment_generator(buffer, segment=None, tokens=None,
+                               window=None):
+    """Generates tokens and comments.
+
+    If ``window`` is a Token, it is moved from token to token and yielded
+    instead of a new Token each time: it must be read before getting the next
+    element.
+    """
+    if tokens is None:
+        tokens = token_stream(buffer, segment)
+    reader = tokens.reader()
+
+    if segment is None:
+        yield from _token_or_comment_generator(reader, window=window)
+        return
+
+    end_token = None
+    if not segment.last:
+        # The next segment starts with a document start, not the stream end
+        line = segment.line + yaml_line_count(buffer, segment.start,
+                                              segment.end)
+        end_token = yaml.DocumentStartToken(
+            yaml.Mark(tokens.scanner.name, segment.end, line, 0,
+                      segment.marked_buffer, segment.end),
+            yaml.Mark(tokens.scanner.name, segment.end + 3, line, 3,
+                      segment.marked_buffer, segment.end + 3))
+
+    for elem in _token_or_comment_generator(reader, segment.prev,
+                                            not segment.first, end_token,
+                                            window):
+        if isinstance(elem, Token):
+            if segment.head is None:
+                segment.head = elem.curr
+            segment.tail = elem.curr
+            segment.token_count += 1
+        yield elem
 
+    segment.flow_level = tokens.scanner.flow_level
+    segment.complete = tokens.scanner.done
 
-def token_or_comment_generator(buffer):
-    yaml_loader = yaml.BaseLoader(buffer)
 
+def _token_or_comment_generator(yaml_loader, prev=None, skip_start=False,
+                                end_token=None, window=None):
     try:
-        prev = None
         curr = yaml_loader.get_token()
-        while curr is not None:
+        if skip_start:
+            curr = yaml_loader.get_token()
+        while curr is not None and curr is not end_token:
             next = yaml_loader.get_token()
-            nextnext = (yaml_loader.peek_token()
-                        if yaml_loader.check_token() else None)
+            nextnext = yaml_loader.peek_token()
+            if end_token is not None:
+                if isinstance(next, yaml.StreamEndToken):
+                    next = end_token
+                elif isinstance(nextnext, yaml.StreamEndToken):
+                    nextnext = end_token
 
-            yield Token(curr.start_mark.line + 1, curr, prev, next, nextnext)
+            if window is None:
+                yield Token(curr.start_mark.line + 1, curr, prev, next,
+                            nextnext)
+            else:
+                window.line_no = curr.start_mark.line + 1
+                window.curr = curr
+                window.prev = prev
+                window.next = next
+                window.nextnext = nextnext
+                yield window
 
             yield from comments_between_tokens(curr, next)
 
@@ -141,10 +553,12 @@ def token_or_comment_generator(buffer):
         pass
 
 
-def token_or_comment_or_line_generator(buffer):
+def token_or_comment_or_line_generator(buffer, segment=None, tokens=None,
+                                       window=None, line_window=None):
     """Generator that mixes tokens and lines, ordering them by line number"""
-    tok_or_com_gen = token_or_comment_generator(buffer)
-    line_gen = line_generator(buffer)
+    tok_or_com_gen = token_or_comment_generator(buffer, segment, tokens,
+                                                window)
+    line_gen = line_generator(buffer, segment, line_window)
 
     tok_or_com = next(tok_or_com_gen, None)
     line = next(line_gen, None)
@@ -66,8 +66,34 @@ _RULES = {
 }
 
 
+# Rules of installed packages are entry points of this group, named after the
+# rule ID. They are only imported when a configuration uses them.
+ENTRY_POINT_GROUP = 'yamllint.rules'
+
+
+def _load_plugin(id):
+    import importlib.metadata
+    try:
+        entry_points = importlib.metadata.entry_points(
+            group=ENTRY_POINT_GROUP, name=id)
+    except TypeError:  # Python < 3.10
+        entry_points = [
+            entry_point for entry_point in
+            importlib.metadata.entry_points().get(ENTRY_POINT_GROUP, ())
+            if entry_point.name == id]
+    for entry_point in entry_points:
+        rule = entry_point.load()
+        if rule.ID != id:
+            raise ValueError(f'rule "{id}" of {entry_point.value} has ID '
+                             f'"{rule.ID}"')
+        return rule
+
+
 def get(id):
     if id not in _RULES:
-        raise ValueError(f'no such rule: "{id}"')
+        rule = _load_plugin(id)
+        if rule is None:
+            raise ValueError(f'no such rule: "{id}"')
+        _RULES[id] = rule
 
     return _RULES[id]
@@ -116,6 +116,13 @@ CONF = {'forbid-undeclared-aliases': bool,
 DEFAULT = {'forbid-undeclared-aliases': True,
            'forbid-duplicated-anchors': False,
            'forbid-unused-anchors': False}
+# Context entries that are not needed from a YAML document to the next one
+# (they are dropped when linting documents separately)
+DOCUMENT_CONTEXT = ('anchors',)
+
+
+def applies(conf, features):
+    return '&' in features or '*' in features
 
 
 def check(conf, token, prev, next, nextnext, context):
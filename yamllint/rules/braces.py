@@ -149,6 +149,11 @@ DEFAULT = {'forbid': False,
            'max-spaces-inside': 0,
            'min-spaces-inside-empty': -1,
            'max-spaces-inside-empty': -1}
+TOKENS = (yaml.FlowMappingStartToken, yaml.FlowMappingEndToken)
+
+
+def applies(conf, features):
+    return '{' in features or '}' in features
 
 
 def check(conf, token, prev, next, nextnext, context):
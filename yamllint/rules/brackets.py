@@ -150,6 +150,11 @@ DEFAULT = {'forbid': False,
            'max-spaces-inside': 0,
            'min-spaces-inside-empty': -1,
            'max-spaces-inside-empty': -1}
+TOKENS = (yaml.FlowSequenceStartToken, yaml.FlowSequenceEndToken)
+
+
+def applies(conf, features):
+    return '[' in features or ']' in features
 
 
 def check(conf, token, prev, next, nextnext, context):
@@ -88,6 +88,7 @@ CONF = {'max-spaces-before': int,
         'max-spaces-after': int}
 DEFAULT = {'max-spaces-before': 0,
            'max-spaces-after': 1}
+TOKENS = (yaml.ValueToken, yaml.KeyToken)
 
 
 def check(conf, token, prev, next, nextnext, context):
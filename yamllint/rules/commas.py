@@ -114,6 +114,11 @@ CONF = {'max-spaces-before': int,
 DEFAULT = {'max-spaces-before': 0,
            'min-spaces-after': 1,
            'max-spaces-after': 1}
+TOKENS = (yaml.FlowEntryToken,)
+
+
+def applies(conf, features):
+    return ',' in features
 
 
 def check(conf, token, prev, next, nextnext, context):
@@ -85,6 +85,10 @@ DEFAULT = {'require-starting-space': True,
            'min-spaces-from-content': 2}
 
 
+def applies(conf, features):
+    return '#' in features
+
+
 def check(conf, comment):
     if (conf['min-spaces-from-content'] != -1 and comment.is_inline() and
             comment.pointer - comment.token_before.end_mark.pointer <
@@ -83,6 +83,10 @@ ID = 'comments-indentation'
 TYPE = 'comment'
 
 
+def applies(conf, features):
+    return '#' in features
+
+
 # Case A:
 #
 #     prev: line:
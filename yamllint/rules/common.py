@@ -18,6 +18,7 @@ import string
 import yaml
 
 from yamllint.linter import LintProblem
+from yamllint.parser import line_index
 
 
 def spaces_after(token, prev, next, min=-1, max=-1,
@@ -49,12 +50,8 @@ def spaces_before(token, prev, next, min=-1, max=-1,
 
 def get_line_indent(token):
     """Finds the indent of the line the token starts in."""
-    start = token.start_mark.buffer.rfind('\n', 0,
-                                          token.start_mark.pointer) + 1
-    content = start
-    while token.start_mark.buffer[content] == ' ':
-        content += 1
-    return content - start
+    index = line_index(token.start_mark)
+    return index.indent(index.line_no(token.start_mark.pointer))
 
 
 def get_real_end_line(token):
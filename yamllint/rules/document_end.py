@@ -89,6 +89,8 @@ ID = 'document-end'
 TYPE = 'token'
 CONF = {'present': bool}
 DEFAULT = {'present': True}
+TOKENS = (yaml.StreamEndToken, yaml.DocumentStartToken,
+          yaml.DocumentEndToken)
 
 
 def check(conf, token, prev, next, nextnext, context):
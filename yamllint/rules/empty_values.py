@@ -113,6 +113,7 @@ CONF = {'forbid-in-block-mappings': bool,
 DEFAULT = {'forbid-in-block-mappings': True,
            'forbid-in-flow-mappings': True,
            'forbid-in-block-sequences': True}
+TOKENS = (yaml.ValueToken, yaml.BlockEntryToken)
 
 
 def check(conf, token, prev, next, nextnext, context):
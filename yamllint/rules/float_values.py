@@ -104,6 +104,7 @@ DEFAULT = {
     'forbid-nan': False,
     'forbid-inf': False,
 }
+TOKENS = (yaml.ScalarToken,)
 
 IS_NUMERAL_BEFORE_DECIMAL_PATTERN = (
     re.compile(r'[-+]?(\.[0-9]+)([eE][-+]?[0-9]+)?$')
@@ -83,6 +83,7 @@ ID = 'hyphens'
 TYPE = 'token'
 CONF = {'max-spaces-after': int}
 DEFAULT = {'max-spaces-after': 1}
+TOKENS = (yaml.BlockEntryToken,)
 
 
 def check(conf, token, prev, next, nextnext, context):
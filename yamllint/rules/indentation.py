@@ -202,6 +202,7 @@ Use this rule to control the indentation.
 import yaml
 
 from yamllint.linter import LintProblem
+from yamllint.parser import line_index
 from yamllint.rules.common import get_real_end_line, is_explicit_key
 
 ID = 'indentation'
@@ -212,6 +213,9 @@ CONF = {'spaces': (int, 'consistent'),
 DEFAULT = {'spaces': 'consistent',
            'indent-sequences': True,
            'check-multi-line-strings': False}
+# Context entries that are not needed from a YAML document to the next one
+# (they are dropped when linting documents separately)
+DOCUMENT_CONTEXT = ('cur_line', 'cur_line_indent')
 
 ROOT, B_MAP, F_MAP, B_SEQ, F_SEQ, B_ENT, KEY, VAL = range(8)
 labels = ('ROOT', 'B_MAP', 'F_MAP', 'B_SEQ', 'F_SEQ', 'B_ENT', 'KEY', 'VAL')
@@ -283,18 +287,15 @@ def check_scalar_indentation(conf, token, context):
 
     line_no = token.start_mark.line + 1
 
-    line_start = token.start_mark.pointer
-    while True:
-        line_start = token.start_mark.buffer.find(
-            '\n', line_start, token.end_mark.pointer - 1) + 1
-        if line_start == 0:
-            break
+    # Lines that start inside the token
+    index = line_index(token.start_mark)
+    first = index.line_no(token.start_mark.pointer) + 1
+    last = index.line_no(token.end_mark.pointer - 1)
+    for i in range(first, last + 1):
         line_no += 1
 
-        indent = 0
-        while token.start_mark.buffer[line_start + indent] == ' ':
-            indent += 1
-        if token.start_mark.buffer[line_start + indent] == '\n':
+        indent = index.indent(i)
+        if token.start_mark.buffer[index.start(i) + indent] == '\n':
             continue
 
         if expected_indent is None:
@@ -309,9 +310,10 @@ def check_scalar_indentation(conf, token, context):
 def _check(conf, token, prev, next, nextnext, context):
     if 'stack' not in context:
         context['stack'] = [Parent(ROOT, 0)]
-        context['cur_line'] = -1
         context['spaces'] = conf['spaces']
         context['indent-sequences'] = conf['indent-sequences']
+    if 'cur_line' not in context:
+        context['cur_line'] = -1
 
     # Step 1: Lint
 
@@ -111,46 +111,28 @@ from locale import strcoll
 import yaml
 
 from yamllint.linter import LintProblem
+from yamllint.parser import Nesting
 
 ID = 'key-ordering'
 TYPE = 'token'
 
 CONF = {'ignored-keys': [str]}
 DEFAULT = {'ignored-keys': []}
-MAP, SEQ = range(2)
-
-
-class Parent:
-    def __init__(self, type):
-        self.type = type
-        self.keys = []
+TOKENS = (yaml.KeyToken,)
+NESTING = True
 
 
 def check(conf, token, prev, next, nextnext, context):
-    if 'stack' not in context:
-        context['stack'] = []
-
-    if isinstance(token, (yaml.BlockMappingStartToken,
-                          yaml.FlowMappingStartToken)):
-        context['stack'].append(Parent(MAP))
-    elif isinstance(token, (yaml.BlockSequenceStartToken,
-                            yaml.FlowSequenceStartToken)):
-        context['stack'].append(Parent(SEQ))
-    elif isinstance(token, (yaml.BlockEndToken,
-                            yaml.FlowMappingEndToken,
-                            yaml.FlowSequenceEndToken)):
-        context['stack'].pop()
-    elif (isinstance(token, yaml.KeyToken) and
-          isinstance(next, yaml.ScalarToken)):
-        # This check is done because KeyTokens can be found inside flow
-        # sequences... strange, but allowed.
-        if (len(context['stack']) > 0 and context['stack'][-1].type == MAP and
-                not any(re.search(r, next.value)
-                        for r in conf['ignored-keys'])):
-            if any(strcoll(next.value, key) < 0
-                   for key in context['stack'][-1].keys):
-                yield LintProblem(
-                    next.start_mark.line + 1, next.start_mark.column + 1,
-                    f'wrong ordering of key "{next.value}" in mapping')
-            else:
-                context['stack'][-1].keys.append(next.value)
+    # This check is done because KeyTokens can be found inside flow
+    # sequences... strange, but allowed.
+    parent = context['nesting'].parent
+    if (isinstance(next, yaml.ScalarToken) and
+            parent is not None and parent.type == Nesting.MAP and
+            not any(re.search(r, next.value) for r in conf['ignored-keys'])):
+        keys = parent.data.setdefault(ID, [])
+        if any(strcoll(next.value, key) < 0 for key in keys):
+            yield LintProblem(
+                next.start_mark.line + 1, next.start_mark.column + 1,
+                f'wrong ordering of key "{next.value}" in mapping')
+        else:
+            keys.append(next.value)
@@ -97,9 +97,13 @@ Use this rule to set a limit to lines length.
 """
 
 
+import functools
+import re
+
 import yaml
 
 from yamllint.linter import LintProblem
+from yamllint.parser import Line
 
 ID = 'line-length'
 TYPE = 'line'
@@ -155,3 +159,21 @@ def check(conf, line):
         yield LintProblem(line.line_no, conf['max'] + 1,
                           'line too long (%d > %d characters)' %
                           (line.end - line.start, conf['max']))
+
+
+@functools.lru_cache
+def long_line_pattern(max):
+    return re.compile('^[^\n]{%d,}' % (max + 1), re.MULTILINE)
+
+
+def check_lines(conf, buffer, start, end, line_no):
+    line_start = start
+    for match in long_line_pattern(conf['max']).finditer(buffer, start, end):
+        line_no += buffer.count('\n', line_start, match.start())
+        line_start = match.start()
+        line_end = match.end()
+        # Like in lines, a '\r' before '\n' is not part of the line
+        if (buffer[line_end - 1] == '\r' and
+                buffer[line_end:line_end + 1] == '\n'):
+            line_end -= 1
+        yield from check(conf, Line(line_no, buffer, line_start, line_end))
@@ -82,10 +82,15 @@ CONF = {'forbid-implicit-octal': bool,
         'forbid-explicit-octal': bool}
 DEFAULT = {'forbid-implicit-octal': True,
            'forbid-explicit-octal': True}
+TOKENS = (yaml.ScalarToken,)
 
 IS_OCTAL_NUMBER_PATTERN = re.compile(r'^[0-7]+$')
 
 
+def applies(conf, features):
+    return '0' in features
+
+
 def check(conf, token, prev, next, nextnext, context):
     if prev and isinstance(prev, yaml.tokens.TagToken):
         return
@@ -173,6 +173,8 @@ DEFAULT = {'quote-type': 'any',
            'extra-allowed': [],
            'allow-quoted-quotes': False,
            'check-keys': False}
+TOKENS = (yaml.ScalarToken,)
+NESTING = True
 
 
 def VALIDATE(conf):
@@ -184,6 +186,12 @@ def VALIDATE(conf):
         return 'cannot use both "required: false" and "extra-allowed"'
 
 
+def applies(conf, features):
+    # Unless unquoted strings are reported, only quoted strings are checked
+    return (conf['required'] is True or bool(conf['extra-required']) or
+            "'" in features or '"' in features)
+
+
 DEFAULT_SCALAR_TAG = 'tag:yaml.org,2002:str'
 
 # https://stackoverflow.com/a/36514274
@@ -240,16 +248,6 @@ def _has_quoted_quotes(token):
 
 
 def check(conf, token, prev, next, nextnext, context):
-    if 'flow_nest_count' not in context:
-        context['flow_nest_count'] = 0
-
-    if isinstance(token, (yaml.FlowMappingStartToken,
-                          yaml.FlowSequenceStartToken)):
-        context['flow_nest_count'] += 1
-    elif isinstance(token, (yaml.FlowMappingEndToken,
-                            yaml.FlowSequenceEndToken)):
-        context['flow_nest_count'] -= 1
-
     if not (isinstance(token, yaml.tokens.ScalarToken) and
             isinstance(prev, (yaml.BlockEntryToken, yaml.FlowEntryToken,
                               yaml.FlowSequenceStartToken, yaml.TagToken,
@@ -308,7 +306,7 @@ def check(conf, token, prev, next, nextnext, context):
         if (token.style and tag == DEFAULT_SCALAR_TAG and token.value and
                 not _quotes_are_needed(token.value,
                                        token.style,
-                                       context['flow_nest_count'] > 0)):
+                                       context['nesting'].flow_level > 0)):
             is_extra_required = any(re.search(r, token.value)
                                     for r in conf['extra-required'])
             is_extra_allowed = any(re.search(r, token.value)
@@ -36,6 +36,7 @@ Use this rule to forbid trailing spaces at the end of lines.
 """
 
 
+import re
 import string
 
 from yamllint.linter import LintProblem
@@ -43,6 +44,11 @@ from yamllint.linter import LintProblem
 ID = 'trailing-spaces'
 TYPE = 'line'
 
+# White space at the end of a line (a '\r' before the '\n' isn't part of the
+# line, but is white space too)
+TRAILING_SPACES_PATTERN = re.compile(r'[ \t\x0b\x0c][ \t\r\x0b\x0c]*$',
+                                     re.MULTILINE)
+
 
 def check(conf, line):
     if line.end == 0:
@@ -58,3 +64,19 @@ def check(conf, line):
     if pos != line.end and line.buffer[pos] in ' \t':
         yield LintProblem(line.line_no, pos - line.start + 1,
                           'trailing spaces')
+
+
+def check_lines(conf, buffer, start, end, line_no):
+    line_start = start
+    for match in TRAILING_SPACES_PATTERN.finditer(buffer, start, end):
+        pos = match.start()
+        line_breaks = buffer.count('\n', line_start, pos)
+        if line_breaks:
+            line_no += line_breaks
+            line_start = buffer.rfind('\n', line_start, pos) + 1
+        # Like check(), only report white space that starts with a space or a
+        # tab (it can start with '\r' before the match)
+        if buffer[pos] in ' \t' and (pos == line_start or
+                                     buffer[pos - 1] != '\r'):
+            yield LintProblem(line_no, pos - line_start + 1,
+                              'trailing spaces')
@@ -157,6 +157,7 @@ ID = 'truthy'
 TYPE = 'token'
 CONF = {'allowed-values': TRUTHY_1_1.copy(), 'check-keys': bool}
 DEFAULT = {'allowed-values': ['true', 'false'], 'check-keys': True}
+TOKENS = (yaml.DirectiveToken, yaml.DocumentEndToken, yaml.ScalarToken)
 
 
 def yaml_spec_version_for_document(context):
@@ -189,5 +190,5 @@ def check(conf, token, prev, next, nextnext, context):
         if token.value in context['bad_truthy_values']:
             yield LintProblem(token.start_mark.line + 1,
                               token.start_mark.column + 1,
-                              "truthy value should be one of [" +
+                              lambda: "truthy value should be one of [" +
                               ", ".join(sorted(conf['allowed-values'])) + "]")
@@ -0,0 +1,138 @@
+# Copyright (C) 2026 agent
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Problems stored by columns, for tools that process many of them.
+
+A ``ProblemTable`` keeps the lines, columns and levels of problems in arrays,
+and their rules and files as codes (indexes in lists of distinct values),
+instead of keeping one ``LintProblem`` object per problem. Descriptions are
+only built when they are read.
+"""
+
+import array
+import json
+
+from yamllint.linter import LintProblem
+
+#: Levels of problems, by code
+LEVELS = (None, 'warning', 'error')
+
+_LEVEL_CODES = {level: code for code, level in enumerate(LEVELS)}
+
+
+class ProblemTable:
+    """Problems of one or more files, stored by columns.
+
+    Columns can be given to libraries that build tables from arrays, with the
+    rules and files as dictionary-encoded columns, for instance
+    ``pyarrow.DictionaryArray.from_arrays(table.rules, table.rule_ids)``.
+    """
+    def __init__(self):
+        #: Line of each problem (starting at 1)
+        self.lines = array.array('L')
+        #: Column of each problem (starting at 1)
+        self.columns = array.array('L')
+        #: Level of each problem, as an index in ``LEVELS``
+        self.levels = array.array('B')
+        #: Rule of each problem, as an index in ``rule_ids``
+        self.rules = array.array('L')
+        #: Distinct rule IDs (``None`` for syntax errors)
+        self.rule_ids = []
+        #: File of each problem, as an index in ``filepaths``
+        self.files = array.array('L')
+        #: Distinct file paths
+        self.filepaths = []
+        # Descriptions, or functions that return them
+        self._descs = []
+        self._rule_codes = {}
+        self._file_codes = {}
+
+    def __len__(self):
+        return len(self.lines)
+
+    def extend(self, problems, filepath=None):
+        """Adds the problems of a file (none of them, if reading them raises
+        an exception).
+
+        :param problems: iterable of LintProblem objects, for instance
+                         returned by ``linter.run()``
+        :param filepath: path of the file the problems were found in
+        """
+        rule_ids, rule_codes = self.rule_ids, self._rule_codes
+        count = len(self)
+        try:
+            for problem in problems:
+                self.lines.append(problem.line)
+                self.columns.append(problem.column)
+                self.levels.append(_LEVEL_CODES[problem.level])
+                self.rules.append(_code(rule_ids, rule_codes, problem.rule))
+                self._descs.append(problem._desc)
+        except BaseException:
+            # Columns must stay aligned: problems of the file are all left out
+            for column in (self.lines, self.columns, self.levels, self.rules,
+                           self._descs):
+                del column[count:]
+            raise
+        if len(self) > count:
+            file = _code(self.filepaths, self._file_codes, filepath)
+            self.files.extend(array.array('L', (file,)) * (len(self) - count))
+
+    def desc(self, i):
+        """Returns the description of the ``i``-th problem."""
+        desc = self._descs[i]
+        if callable(desc):
+            desc = self._descs[i] = desc()
+        return desc
+
+    def problem(self, i):
+        """Returns the ``i``-th problem, as a LintProblem object."""
+        problem = LintProblem(self.lines[i], self.columns[i], self.desc(i),
+                              self.rule_ids[self.rules[i]])
+        problem.level = LEVELS[self.levels[i]]
+        return problem
+
+    def to_dict(self):
+        """Returns the columns as a dict of sequences, with rule IDs, levels
+        and file paths instead of their codes (the format of
+        ``pyarrow.RecordBatch.from_pydict()``)."""
+        return {'file': [self.filepaths[file] for file in self.files],
+                'line': self.lines,
+                'column': self.columns,
+                'level': [LEVELS[level] for level in self.levels],
+                'rule': [self.rule_ids[rule] for rule in self.rules],
+                'desc': [self.desc(i) for i in range(len(self))]}
+
+    def write_json_lines(self, stream):
+        """Writes one JSON object per problem to a text stream."""
+        files = [json.dumps(filepath) for filepath in self.filepaths]
+        levels = [json.dumps(level) for level in LEVELS]
+        rules = [json.dumps(rule) for rule in self.rule_ids]
+        for i in range(len(self)):
+            stream.write(
+                f'{{"file": {files[self.files[i]]}, '
+                f'"line": {self.lines[i]}, "column": {self.columns[i]}, '
+                f'"level": {levels[self.levels[i]]}, '
+                f'"rule": {rules[self.rules[i]]}, '
+                f'"desc": {json.dumps(self.desc(i))}}}\n')
+
+
+def _code(values, codes, value):
+    """Returns the index of a value in a list of distinct values, and adds it
+    if it is not there yet."""
+    code = codes.get(value)
+    if code is None:
+        code = codes[value] = len(values)
+        values.append(value)
+    return code